@@ -1,10 +1,12 @@
 # app/sop_builder.py - Enhanced with event-driven preview updates
 import customtkinter as ctk
-from typing import List, Optional, Dict, Tuple
+import threading
+from typing import Any, List, Optional, Dict, Tuple
 from modules.base_module import Module
 from modules.module_factory import ModuleFactory
 from gui.main_window import MainWindow, AVAILABLE_MODULES
 from gui.canvas_panel import CanvasPanel
+from gui.renderers.module_widget_manager import preview_text
 from gui.properties_panel import PropertiesPanel
 from modules.complex_module import TabModule
 from pathlib import Path
@@ -27,6 +29,7 @@ class SOPBuilderApp:
         self.current_project_path: Optional[Path] = None
         self.selected_module: Optional[Module] = None
         self.is_modified = False
+        self._loading_project = False  # New/Open wait until a project open has finished
 
         # Tab context tracking
         self.selected_tab_context: Optional[Tuple[TabModule, str]] = None  # (TabModule, tab_name)
@@ -385,6 +388,10 @@ class SOPBuilderApp:
 
     def new_project(self):
         """Create a new SOP project with base template"""
+        if self._loading_project:
+            self.main_window.set_status("Please wait - a project is still opening", "orange")
+            return
+
         if self.is_modified:
             response = messagebox.askyesnocancel(
                 "Save Changes?",
@@ -411,6 +418,10 @@ class SOPBuilderApp:
 
     def create_blank_project(self):
         """Create a completely blank project (for advanced users)"""
+        if self._loading_project:
+            self.main_window.set_status("Please wait - a project is still opening", "orange")
+            return
+
         if self.is_modified:
             response = messagebox.askyesnocancel(
                 "Save Changes?",
@@ -441,6 +452,10 @@ class SOPBuilderApp:
 
     def open_project(self, filename_str=None):
         """Open an existing project with tab hierarchy"""
+        if self._loading_project:
+            self.main_window.set_status("Please wait - a project is still opening", "orange")
+            return
+
         if not filename_str:
             filename_str = filedialog.askopenfilename(
                 title="Open SOP Project",
@@ -448,32 +463,85 @@ class SOPBuilderApp:
             )
 
         if filename_str:
-            try:
-                # Load project
-                project_data = self.project_manager.load_project(filename_str)
+            self.main_window.set_status("Opening project...", "blue")
+            self._loading_project = True
 
-                # Clear current
-                self.active_modules.clear()
-                self.canvas_panel.clear()
-                self.selected_tab_context = None
+            # Read and deserialize the project off the UI thread; widgets are built back on it
+            result: Dict[str, Any] = {}
+            loader = threading.Thread(target=self._load_project_modules, args=(filename_str, result), daemon=True)
+            loader.start()
+            self._poll_project_load(loader, filename_str, result)
 
-                # Load modules with hierarchy
-                for module_data in project_data['modules']:
-                    module = self.project_manager.deserialize_module(module_data)
-                    self.active_modules.append(module)
-                    self.canvas_panel.add_module_widget(module, with_nested=True)
+    def _load_project_modules(self, filename_str: str, result: Dict[str, Any]):
+        """Load and deserialize a project (runs on a worker thread - must not touch Tk)"""
+        try:
+            project_data = self.project_manager.load_project(filename_str)
+            modules = [self.project_manager.deserialize_module(module_data)
+                       for module_data in project_data['modules']]
+            # Keep top-level modules in position order so views can iterate them directly,
+            # renumbered in case the saved positions have gaps or duplicates
+            modules.sort(key=lambda m: m.position)
+            for i, module in enumerate(modules):
+                module.position = i
+
+            # Warm the preview text cache so building the widgets finds the text already formatted
+            for module in modules:
+                preview_text(module)
+                if isinstance(module, TabModule):
+                    for nested_module in module.get_all_nested_modules():
+                        preview_text(nested_module)
+
+            result['modules'] = modules
+        except Exception as e:
+            result['error'] = e
 
-                self.current_project_path = Path(filename_str)
-                self.set_modified(False)
-                self.root.title(f"SOP Builder - {self.current_project_path.name}")
-                self.main_window.set_status(f"Opened {self.current_project_path.name}", "green")
+    def _poll_project_load(self, loader: threading.Thread, filename_str: str, result: Dict[str, Any]):
+        """Wait for the loader thread without blocking the UI, then build the canvas"""
+        if loader.is_alive():
+            self.root.after(16, self._poll_project_load, loader, filename_str, result)
+            return
 
-                # Trigger preview update for opened project
-                self.preview_manager.request_preview_update()
+        if 'error' in result:
+            self._on_open_project_failed(result['error'])
+            return
 
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to open project: {str(e)}")
-                self.main_window.set_status("Failed to open project", "red")
+        # Clear current
+        self.active_modules.clear()
+        self.canvas_panel.clear()
+        self.current_project_path = None  # A save during the load must not overwrite the previous file
+        self.selected_tab_context = None
+        self.set_modified(False)
+
+        # Load modules with hierarchy, a frame's worth of widgets at a time. Each module joins
+        # active_modules only once its widget exists, so edits made meanwhile see a consistent canvas
+        self.canvas_panel.load_module_widgets(
+            result['modules'],
+            on_built=self.active_modules.append,
+            on_done=lambda: self._on_project_opened(filename_str),
+            on_error=self._on_open_project_failed
+        )
+
+    def _on_project_opened(self, filename_str: str):
+        """Finish opening a project once all module widgets are built"""
+        self._loading_project = False
+        self.current_project_path = Path(filename_str)
+
+        # Modules added while the project was loading went in between the loaded ones
+        self._update_module_positions()
+
+        # Keep the modified marker if the project was edited while it was loading
+        self.root.title(f"SOP Builder - {self.current_project_path.name}")
+        self.set_modified(self.is_modified)
+        self.main_window.set_status(f"Opened {self.current_project_path.name}", "green")
+
+        # Trigger preview update for opened project
+        self.preview_manager.request_preview_update()
+
+    def _on_open_project_failed(self, error: Exception):
+        """Report a project that could not be opened"""
+        self._loading_project = False
+        messagebox.showerror("Error", f"Failed to open project: {str(error)}")
+        self.main_window.set_status("Failed to open project", "red")
 
     def save_project(self, save_as=False):
         """Save current project with tab hierarchy"""
@@ -719,18 +787,19 @@ class SOPBuilderApp:
 
     def update_module_property(self, module: Module, property_name: str, value: any):
         """Update a module property (enhanced with preview updates)"""
+        structure_version = module.structure_version
         module.update_content(property_name, value)
 
-        # Update canvas preview
-        self.canvas_panel.update_module_preview(module)
+        # Content edits only need the preview text updated in place; structural
+        # changes (e.g. the tab list) rebuild the module widget
+        if module.structure_version != structure_version:
+            self.canvas_panel._refresh_tab_module(module)
+        else:
+            self.canvas_panel.update_module_preview(module)
 
         # Update live preview if enabled
         self.preview_manager.request_preview_update()
 
-        # Handle special tab module updates
-        if isinstance(module, TabModule) and property_name == 'tabs':
-            self.canvas_panel._refresh_tab_module(module)
-
         self.set_modified(True)
 
     def run(self):
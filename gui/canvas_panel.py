@@ -1,25 +1,55 @@
 # gui/canvas_panel.py - Updated with event-driven preview updates
 import customtkinter as ctk
-from typing import Dict, Optional, Tuple, Any
+import time
+from typing import Callable, Dict, List, Optional, Tuple, Any
 from modules.base_module import Module
 from modules.complex_module import TabModule
 from gui.handlers.canvas_drag_drop_handler import CanvasDragDropHandler
 from gui.handlers.library_drag_drop_handler import LibraryDragDropHandler
 from gui.renderers.module_widget_manager import ModuleWidgetManager
 from gui.renderers.tab_widget_manager import TabWidgetManager
+from gui.utils.widget_safety import safe_widget_exists
 import tkinter as tk
 
 
 class CanvasPanel:
     """Central panel for arranging modules with enhanced drag and drop support and event-driven preview updates"""
 
+    __slots__ = (
+        'parent',
+        'app',
+        'preview_mode',
+        '_module_index',
+        '_tab_index',
+        '_pending_tab_refreshes',
+        '_refresh_handle',
+        '_modified_handle',
+        '_pending_load',
+        'drag_drop_handler',
+        'library_drag_drop_handler',
+        'modules_frame',
+        'module_widget_manager',
+        'tab_widget_manager',
+    )
+
     def __init__(self, parent, app_instance):
         self.parent = parent
         self.app = app_instance
         self.preview_mode = False
 
-        # Track widgets scheduled for destruction to prevent access
-        self.widgets_being_destroyed = set()
+        # Cached module id -> list index maps used by the move up/down controls
+        self._module_index: Dict[str, int] = {}
+        self._tab_index: Dict[Tuple[str, str], Dict[str, int]] = {}
+
+        # Tab refreshes queued for the next idle pass - (tab_module_id, tab_name) -> (tab_module, tab_name)
+        self._pending_tab_refreshes: Dict[Tuple[str, str], Tuple[TabModule, str]] = {}
+        self._refresh_handle: Optional[str] = None
+
+        # Pending idle call that marks the project modified
+        self._modified_handle: Optional[str] = None
+
+        # After handle of an in-progress chunked load
+        self._pending_load: Optional[str] = None
 
         # Initialize drag and drop handlers
         self.drag_drop_handler = CanvasDragDropHandler(self, app_instance)
@@ -32,7 +62,7 @@ class CanvasPanel:
             modules_frame=self.modules_frame,
             app_instance=app_instance,
             drag_drop_handler=self.drag_drop_handler,
-            safe_widget_exists_func=self._safe_widget_exists,
+            safe_widget_exists_func=safe_widget_exists,
             safe_destroy_widget_func=self._safe_destroy_widget
         )
 
@@ -41,7 +71,7 @@ class CanvasPanel:
             app_instance=app_instance,
             module_widget_manager=self.module_widget_manager,
             library_drag_drop_handler=self.library_drag_drop_handler,
-            safe_widget_exists_func=self._safe_widget_exists,
+            safe_widget_exists_func=safe_widget_exists,
             safe_destroy_widget_func=self._safe_destroy_widget
         )
 
@@ -53,6 +83,7 @@ class CanvasPanel:
             fg_color=("gray92", "gray12")
         )
         self.modules_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        self.modules_frame._original_color = self.modules_frame.cget("fg_color")
 
         # Enable the canvas as a drop zone for library modules
         self.library_drag_drop_handler.setup_library_drop_zone()
@@ -61,25 +92,15 @@ class CanvasPanel:
         """Handle dropping a module from the library"""
         return self.library_drag_drop_handler.handle_library_drop(drop_target, module_type)
 
-    def _safe_widget_exists(self, widget):
-        """Safely check if a widget exists and hasn't been destroyed"""
-        if widget is None:
-            return False
-        if id(widget) in self.widgets_being_destroyed:
-            return False
-        try:
-            return widget.winfo_exists()
-        except tk.TclError:
-            return False
-
     def _safe_destroy_widget(self, widget):
         """Safely destroy a widget with proper cleanup"""
-        if not self._safe_widget_exists(widget):
+        if not safe_widget_exists(widget):
             return
 
         try:
-            # Mark widget as being destroyed
-            self.widgets_being_destroyed.add(id(widget))
+            # Mark widget as being destroyed - the flag lives on the widget itself, so a
+            # recycled id() can never make an unrelated widget look destroyed
+            widget._destroying = True
 
             # Clear any selection
             if hasattr(self.module_widget_manager,
@@ -91,8 +112,13 @@ class CanvasPanel:
                        'library_drop_highlight') and self.library_drag_drop_handler.library_drop_highlight == widget:
                 self.library_drag_drop_handler.library_drop_highlight = None
 
-            # Unbind all events recursively
-            self._unbind_all_events(widget)
+            # Unbind only the events recorded on this widget - Tk drops the rest of the
+            # subtree's bindings itself when the widget is destroyed
+            for bound_widget, sequence in getattr(widget, '_bound_events', ()):
+                try:
+                    bound_widget.unbind(sequence)
+                except tk.TclError:
+                    pass
 
             # Destroy the widget
             widget.destroy()
@@ -100,40 +126,11 @@ class CanvasPanel:
         except tk.TclError:
             # Widget already destroyed
             pass
-        finally:
-            # Remove from tracking set
-            if id(widget) in self.widgets_being_destroyed:
-                self.widgets_being_destroyed.remove(id(widget))
-
-    def _unbind_all_events(self, widget):
-        """Recursively unbind all events from a widget and its children"""
-        if not self._safe_widget_exists(widget):
-            return
-
-        try:
-            # Unbind common events
-            events_to_unbind = [
-                '<Button-1>', '<B1-Motion>', '<ButtonRelease-1>',
-                '<Enter>', '<Leave>', '<KeyRelease>', '<FocusIn>', '<FocusOut>',
-                '<Motion>'  # Added Motion event
-            ]
-
-            for event in events_to_unbind:
-                try:
-                    widget.unbind(event)
-                except:
-                    pass
-
-            # Recursively unbind for children
-            for child in widget.winfo_children():
-                self._unbind_all_events(child)
-
-        except tk.TclError:
-            # Widget no longer exists
-            pass
 
     def add_module_widget(self, module: Module, with_nested: bool = False):
         """Add visual representation of module"""
+        self._invalidate_module_index()
+
         # Delegate to module widget manager
         self.module_widget_manager.add_module_widget(module, with_nested)
 
@@ -144,12 +141,42 @@ class CanvasPanel:
             if module_frame:
                 self.tab_widget_manager.create_tab_content_areas(module, module_frame, with_nested)
 
+    def load_module_widgets(self, modules: List[Module], on_built: Callable[[Module], None],
+                            on_done: Callable[[], None], on_error: Callable[[Exception], None],
+                            frame_budget: float = 0.016):
+        """Build widgets for many modules a few at a time so each event loop tick stays within frame_budget
+
+        on_built is called with each module as soon as its widget exists.
+        """
+        pending = iter(modules)
+
+        def commit_batch():
+            deadline = time.perf_counter() + frame_budget
+            try:
+                for module in pending:
+                    self.add_module_widget(module, with_nested=True)
+                    on_built(module)
+                    if time.perf_counter() >= deadline:
+                        self._pending_load = self.parent.after(1, commit_batch)
+                        return
+            except Exception as e:
+                self._pending_load = None
+                on_error(e)
+                return
+
+            self._pending_load = None
+            on_done()
+
+        self._pending_load = self.parent.after_idle(commit_batch)
+
     def add_module_to_tab_widget(self, tab_module: TabModule, tab_name: str, module: Module):
         """Add a module widget to a specific tab - delegate to tab widget manager"""
+        self._tab_index.pop((tab_module.id, tab_name), None)
         self.tab_widget_manager.add_module_to_tab_widget(tab_module, tab_name, module)
 
     def remove_module_from_tab_widget(self, tab_module: TabModule, tab_name: str, module_id: str):
         """Remove a module widget from a tab - delegate to tab widget manager"""
+        self._tab_index.pop((tab_module.id, tab_name), None)
         self.tab_widget_manager.remove_module_from_tab_widget(tab_module, tab_name, module_id)
 
     def highlight_tab(self, tab_module: TabModule, tab_name: str):
@@ -163,6 +190,7 @@ class CanvasPanel:
 
     def remove_module_widget(self, module_id: str):
         """Remove module widget from canvas - delegate to module widget manager"""
+        self._invalidate_module_index()
         self.module_widget_manager.remove_module_widget(module_id)
 
     def clear(self):
@@ -171,12 +199,29 @@ class CanvasPanel:
         self.drag_drop_handler.cleanup_on_canvas_clear()
         self.library_drag_drop_handler.cleanup_on_canvas_clear()
 
-        # Clear all module widgets via the manager
-        self.module_widget_manager.clear_all_widgets()
+        # Stop any chunked load so it doesn't build widgets into the new modules frame
+        if self._pending_load is not None:
+            self.parent.after_cancel(self._pending_load)
+            self._pending_load = None
+
+        # A cleared canvas must not be marked modified by edits made before it was cleared
+        if self._modified_handle is not None:
+            self.parent.after_cancel(self._modified_handle)
+            self._modified_handle = None
 
-        # Clear tab tracking dictionaries via tab widget manager
+        # Drop widget references via the managers
+        self.module_widget_manager.forget_all_widgets()
         self.tab_widget_manager.clear_all_tab_widgets()
-        self.widgets_being_destroyed.clear()
+
+        # Destroy the modules frame itself - Tk tears down every module widget beneath it
+        # in a single call - and start over with a fresh one
+        try:
+            self.modules_frame.destroy()
+        except tk.TclError:
+            pass
+        self._setup_canvas()
+        self.module_widget_manager.modules_frame = self.modules_frame
+        self._invalidate_module_index()
 
         # Trigger preview update for cleared canvas
         if hasattr(self.app, 'preview_manager'):
@@ -207,46 +252,31 @@ class CanvasPanel:
 
     def _hide_editing_controls(self):
         """Hide editing controls for preview mode"""
-        for widget_id, widget in self.module_widget_manager.module_widgets.items():
-            if not self._safe_widget_exists(widget):
-                continue
-
-            try:
-                # Find and hide control buttons in header
-                for child in widget.winfo_children():
-                    if isinstance(child, ctk.CTkFrame):  # Header frame
-                        for grandchild in child.winfo_children():
-                            if isinstance(grandchild, ctk.CTkFrame):  # Controls frame
-                                grandchild.pack_forget()
-                            elif hasattr(grandchild, 'text') and grandchild.cget('text') == '⋮⋮':
-                                grandchild.pack_forget()  # Hide drag handle
-            except tk.TclError:
-                pass
+        # Hide drag handles and control buttons in module headers
+        self.module_widget_manager.set_preview_mode(True)
 
         # Hide controls in tab modules too
-        for tab_id, tab_containers in self.tab_widget_manager.tab_widgets.items():
-            for tab_name, container in tab_containers.items():
-                if self._safe_widget_exists(container):
-                    # Hide tab controls
-                    parent = container.master
-                    while parent:
-                        if hasattr(parent, '_tab_selector_frame'):
-                            try:
-                                parent._tab_selector_frame.pack_forget()
-                                break
-                            except:
-                                pass
-                        parent = getattr(parent, 'master', None)
+        for selector_frame in self.tab_widget_manager.tab_selectors.values():
+            if safe_widget_exists(selector_frame):
+                try:
+                    selector_frame.pack_forget()
+                except tk.TclError:
+                    pass
 
     def _show_editing_controls(self):
         """Show editing controls for edit mode"""
-        # Refresh the entire canvas to restore controls
-        self.module_widget_manager.refresh_widget_order()
+        # Restore drag handles and control buttons in module headers
+        self.module_widget_manager.set_preview_mode(False)
 
-        # Restore tab controls
-        for module in self.app.active_modules:
-            if isinstance(module, TabModule):
-                self.tab_widget_manager.refresh_tab_module(module)
+        # Restore tab controls above their content areas
+        for tab_module_id, selector_frame in self.tab_widget_manager.tab_selectors.items():
+            tab_container = self.tab_widget_manager.tab_containers.get(tab_module_id)
+            if not safe_widget_exists(selector_frame) or not safe_widget_exists(tab_container):
+                continue
+            try:
+                selector_frame.pack(fill="x", padx=2, pady=2, before=tab_container._content_area)
+            except tk.TclError:
+                pass
 
     def clear_tab_context(self):
         """Clear the tab context and reset to main canvas adding"""
@@ -267,16 +297,13 @@ class CanvasPanel:
             tab_module, tab_name = parent_tab
             if tab_name in tab_module.sub_modules:
                 modules = tab_module.sub_modules[tab_name]
-                current_index = None
-                for i, m in enumerate(modules):
-                    if m.id == module.id:
-                        current_index = i
-                        break
+                index_map = self._tab_index.setdefault((tab_module.id, tab_name), {})
+                current_index = self._lookup_module_index(modules, module.id, index_map)
 
                 if current_index is not None and current_index > 0:
-                    tab_module.reorder_module_in_tab(tab_name, module.id, current_index - 1)
-                    self.tab_widget_manager.refresh_tab_content(tab_module, tab_name)
-                    self.app.set_modified(True)
+                    tab_module.reorder_module_in_tab(tab_name, module.id, current_index - 1, current_index)
+                    self._swap_module_index(modules, index_map, current_index, current_index - 1)
+                    self._repack_swapped_tab_modules(tab_module, tab_name, current_index - 1)
                     moved = True
         else:
             # Module is on main canvas
@@ -295,16 +322,13 @@ class CanvasPanel:
             tab_module, tab_name = parent_tab
             if tab_name in tab_module.sub_modules:
                 modules = tab_module.sub_modules[tab_name]
-                current_index = None
-                for i, m in enumerate(modules):
-                    if m.id == module.id:
-                        current_index = i
-                        break
+                index_map = self._tab_index.setdefault((tab_module.id, tab_name), {})
+                current_index = self._lookup_module_index(modules, module.id, index_map)
 
                 if current_index is not None and current_index < len(modules) - 1:
-                    tab_module.reorder_module_in_tab(tab_name, module.id, current_index + 1)
-                    self.tab_widget_manager.refresh_tab_content(tab_module, tab_name)
-                    self.app.set_modified(True)
+                    tab_module.reorder_module_in_tab(tab_name, module.id, current_index + 1, current_index)
+                    self._swap_module_index(modules, index_map, current_index, current_index + 1)
+                    self._repack_swapped_tab_modules(tab_module, tab_name, current_index)
                     moved = True
         else:
             # Module is on main canvas
@@ -314,6 +338,54 @@ class CanvasPanel:
         if moved and hasattr(self.app, 'preview_manager'):
             self.app.preview_manager.request_preview_update()
 
+    def _repack_swapped_tab_modules(self, tab_module: TabModule, tab_name: str, index: int):
+        """Move the frame now at index in front of its neighbour, falling back to a full tab refresh"""
+        modules = tab_module.sub_modules[tab_name]
+        parent_tab = (tab_module, tab_name)
+        widget_key = self.module_widget_manager.widget_key
+        module_widgets = self.module_widget_manager.module_widgets
+
+        first = module_widgets.get(widget_key(modules[index].id, parent_tab))
+        second = module_widgets.get(widget_key(modules[index + 1].id, parent_tab))
+        if first is not None and second is not None:
+            try:
+                # Only the packing order changes, so go through Tk directly and leave CTk's record
+                # of each frame's original pack call intact for scaling changes to replay
+                tk.Pack.pack_configure(first, before=second)
+                self.schedule_modified()
+                return
+            except tk.TclError:
+                pass
+
+        self._schedule_tab_refresh(tab_module, tab_name)
+
+    def _schedule_tab_refresh(self, tab_module: TabModule, tab_name: str):
+        """Queue a tab content refresh so rapid moves in the same tab redraw it only once"""
+        self._pending_tab_refreshes[(tab_module.id, tab_name)] = (tab_module, tab_name)
+        if self._refresh_handle is None:
+            self._refresh_handle = self.parent.after_idle(self._flush_tab_refreshes)
+
+    def _flush_tab_refreshes(self):
+        """Apply queued tab refreshes once each and mark the project modified"""
+        self._refresh_handle = None
+        pending, self._pending_tab_refreshes = self._pending_tab_refreshes, {}
+
+        for tab_module, tab_name in pending.values():
+            self.tab_widget_manager.refresh_tab_content(tab_module, tab_name)
+
+        if pending:
+            self.app.set_modified(True)
+
+    def schedule_modified(self):
+        """Mark the project modified on the next idle pass so bursts of edits update the title once"""
+        if self._modified_handle is None:
+            self._modified_handle = self.parent.after_idle(self._flush_modified)
+
+    def _flush_modified(self):
+        """Apply a scheduled modified mark"""
+        self._modified_handle = None
+        self.app.set_modified(True)
+
     def _refresh_tab_module(self, tab_module: TabModule):
         """Refresh the entire tab module widget - delegate to tab widget manager"""
         self.tab_widget_manager.refresh_tab_module(tab_module)
@@ -332,19 +404,39 @@ class CanvasPanel:
 
     def _move_module(self, module_id: str, direction: int) -> bool:
         """Move module up or down on main canvas"""
-        module_index = None
-        for i, module in enumerate(self.app.active_modules):
-            if module.id == module_id:
-                module_index = i
-                break
+        modules = self.app.active_modules
+        module_index = self._lookup_module_index(modules, module_id, self._module_index)
 
         if module_index is not None:
             new_index = module_index + direction
-            if 0 <= new_index < len(self.app.active_modules):
+            if 0 <= new_index < len(modules):
                 self.app.reorder_modules(module_id, new_index)
+                self._swap_module_index(modules, self._module_index, module_index, new_index)
                 return True
         return False
 
+    @staticmethod
+    def _lookup_module_index(modules: List[Module], module_id: str,
+                             index_map: Dict[str, int]) -> Optional[int]:
+        """Look up a module's list index, rebuilding the cached map when it is stale"""
+        index = index_map.get(module_id)
+        if index is None or index >= len(modules) or modules[index].id != module_id:
+            index_map.clear()
+            index_map.update((m.id, i) for i, m in enumerate(modules))
+            index = index_map.get(module_id)
+        return index
+
+    @staticmethod
+    def _swap_module_index(modules: List[Module], index_map: Dict[str, int], old_index: int, new_index: int):
+        """Update the cached index map after two neighbouring modules swapped places"""
+        for index in (old_index, new_index):
+            index_map[modules[index].id] = index
+
+    def _invalidate_module_index(self):
+        """Drop cached module index maps after structural changes"""
+        self._module_index.clear()
+        self._tab_index.clear()
+
     # Provide property access to tab_widgets for backward compatibility
     @property
     def tab_widgets(self):
@@ -1,15 +1,19 @@
 # gui/handlers/canvas_drag_drop_handler.py
 
 import customtkinter as ctk
-from typing import Optional, Dict, Any, Tuple, TYPE_CHECKING
+from typing import Optional, Dict, Any, List, Tuple, TYPE_CHECKING
 import tkinter as tk
-from gui.utils.widget_safety import safe_widget_exists, is_child_of
+from gui.utils.widget_safety import safe_widget_exists, cached_widget_checks
+from gui.utils.bindings import add_bindtag, find_tagged_ancestor
 
 if TYPE_CHECKING:
     from gui.canvas_panel import CanvasPanel
     from modules.base_module import Module
     from modules.complex_module import TabModule
 
+# Bind tag shared by the drag handles of every module frame
+DRAG_HANDLE_TAG = "DragHandle"
+
 
 class CanvasDragDropHandler:
 
@@ -20,9 +24,36 @@ class CanvasDragDropHandler:
         # Drag and drop state
         self.drag_data: Optional[Dict[str, Any]] = None
         self.drop_zone_highlight: Optional[ctk.CTkFrame] = None
-        self.drag_preview: Optional[ctk.CTkToplevel] = None
+        self.drag_preview: Optional[tk.Label] = None  # The overlay label while it is shown
         self.is_dragging = False
 
+        # Drag preview label placed on the root window, created on first use and reused afterwards.
+        # It moves without a window manager round trip and is hidden while the cursor is outside
+        # the app window.
+        self._drag_overlay_label: Optional[tk.Label] = None
+        self._drag_preview_text = ""
+
+        # Motion events are coalesced into one drop-zone update per idle pass
+        self._pending_motion_id: Optional[str] = None
+        self._last_motion_pos: Tuple[int, int] = (0, 0)
+
+        # Screen rectangle of the root window, captured when a drag starts - (left, top, right, bottom)
+        self._root_bounds: Tuple[int, int, int, int] = (0, 0, 0, 0)
+
+        # Drop zone found for each widget walked during the current drag - widget -> drop zone.
+        # Widgets are neither built nor destroyed mid-drag, so it is only reset between drags.
+        self._drop_zone_cache: Dict[Any, Optional[ctk.CTkFrame]] = {}
+
+        # One set of class bindings serves the drag handles of all module frames
+        self.app.root.bind_class(DRAG_HANDLE_TAG, '<Button-1>', self._on_drag_press)
+        self.app.root.bind_class(DRAG_HANDLE_TAG, '<Enter>', lambda event: self._on_drag_handle_hover(event, "gray40"))
+        self.app.root.bind_class(DRAG_HANDLE_TAG, '<Leave>', lambda event: self._on_drag_handle_hover(event, "gray30"))
+
+        # Motion and release are bound once on the 'all' tag and ignored unless a drag is active.
+        # The module library drag rebinds the root window itself, so it can't clobber these.
+        self.app.root.bind_all('<B1-Motion>', self._on_drag_motion_root, add='+')
+        self.app.root.bind_all('<ButtonRelease-1>', self._on_drag_release_root, add='+')
+
     def enable_drag_drop(self, frame: ctk.CTkFrame, module: 'Module',
                          parent_tab: Optional[Tuple['TabModule', str]] = None):
         """Enable drag and drop functionality for a module frame with safety checks"""
@@ -33,136 +64,192 @@ class CanvasDragDropHandler:
             print(f"Warning: No valid drag handle found for module {module.id}")
             return
 
-        def start_drag(event):
-            if (self.canvas_panel.preview_mode or
-                    not safe_widget_exists(frame) or
-                    not safe_widget_exists(drag_handle)):
-                return
+        # The shared DragHandle tag bindings read what to drag from the handle itself
+        drag_handle._drag_ctx = {'module': module, 'parent_tab': parent_tab, 'frame': frame}
+        try:
+            add_bindtag(drag_handle, DRAG_HANDLE_TAG)
+            drag_handle.configure(cursor="hand2")
+        except tk.TclError:
+            pass
 
-            self.is_dragging = True
-            self.drag_data = {
-                'module': module,
-                'parent_tab': parent_tab,
-                'start_x': event.x_root,
-                'start_y': event.y_root,
-                'source_widget': frame
-            }
+    def _on_drag_press(self, event):
+        """Start dragging the module whose handle was pressed"""
+        drag_handle = find_tagged_ancestor(event.widget, '_drag_ctx')
+        if drag_handle is None:
+            return
 
-            # Create drag preview
-            self._create_drag_preview(event.x_root, event.y_root, module.display_name)
+        ctx = drag_handle._drag_ctx
+        frame = ctx['frame']
+        if (self.canvas_panel.preview_mode or
+                not safe_widget_exists(frame) or
+                not safe_widget_exists(drag_handle)):
+            return
 
-            # Bind drag motion to the root window to track mouse movement
-            try:
-                self.app.root.bind('<B1-Motion>', on_drag_motion)
-                self.app.root.bind('<ButtonRelease-1>', end_drag)
-            except tk.TclError:
-                self._cleanup_drag()
-                return
+        self.is_dragging = True
+        self._drop_zone_cache.clear()
+        self._last_motion_pos = (event.x_root, event.y_root)
+        root = self.app.root
+        left, top = root.winfo_rootx(), root.winfo_rooty()
+        self._root_bounds = (left, top, left + root.winfo_width(), top + root.winfo_height())
+        self.drag_data = {
+            'module': ctx['module'],
+            'parent_tab': ctx['parent_tab'],
+            'start_x': event.x_root,
+            'start_y': event.y_root,
+            'source_widget': frame
+        }
+
+        # Create drag preview
+        self._create_drag_preview(event.x_root, event.y_root, ctx['module'].display_name)
+
+        # Make frame semi-transparent during drag
+        try:
+            frame.configure(fg_color=("gray25", "gray25"))
+        except tk.TclError:
+            pass
 
-            # Make frame semi-transparent during drag
-            if safe_widget_exists(frame):
-                try:
-                    frame.configure(fg_color=("gray25", "gray25"))
-                except tk.TclError:
-                    pass
+    def _on_drag_motion_root(self, event):
+        """Track the cursor while a module is being dragged"""
+        if not self.is_dragging or not self.drag_data:
+            return
 
-            # Change cursor
-            if safe_widget_exists(drag_handle):
-                try:
-                    drag_handle.configure(cursor="hand2")
-                except tk.TclError:
-                    pass
+        # Remember the latest position and handle it once the event queue drains
+        position = (event.x_root, event.y_root)
+        if position == self._last_motion_pos:
+            return
+        self._last_motion_pos = position
+        if self._pending_motion_id is None:
+            self._pending_motion_id = self.app.root.after_idle(self._process_motion)
 
-        def on_drag_motion(event):
-            if not self.drag_data or not self.is_dragging:
-                return
+    def _on_drag_release_root(self, event):
+        """Drop the dragged module where the button was released"""
+        if not self.is_dragging or not self.drag_data:
+            return
 
-            # Update drag preview position
-            if self.drag_preview and safe_widget_exists(self.drag_preview):
-                try:
-                    self.drag_preview.geometry(f"200x40+{event.x_root + 10}+{event.y_root + 10}")
-                except Exception:
-                    pass
+        # Hide the preview first - the overlay could otherwise be the widget under the cursor
+        self._hide_drag_preview()
 
-            # Check for drop zones
-            try:
-                widget_under_cursor = self.app.root.winfo_containing(event.x_root, event.y_root)
-                self._update_drop_zone_highlight(widget_under_cursor)
-            except tk.TclError:
-                pass
+        # Find drop target
+        try:
+            drop_target = self.app.root.winfo_containing(event.x_root, event.y_root)
+            self._handle_drop(drop_target, event.x_root, event.y_root)
+        except tk.TclError:
+            pass
 
-        def end_drag(event):
-            if not self.drag_data:
-                return
+        # Cleanup
+        self._cleanup_drag()
 
-            # Find drop target
+    def _on_drag_handle_hover(self, event, fg_color: str):
+        """Highlight a drag handle under the cursor to make it clear it's draggable"""
+        if self.is_dragging:
+            return
+
+        drag_handle = find_tagged_ancestor(event.widget, '_drag_ctx')
+        if safe_widget_exists(drag_handle):
             try:
-                drop_target = self.app.root.winfo_containing(event.x_root, event.y_root)
-                self._handle_drop(drop_target, event.x_root, event.y_root)
+                drag_handle.configure(fg_color=fg_color)
             except tk.TclError:
                 pass
 
-            # Cleanup
-            self._cleanup_drag()
+    def _process_motion(self):
+        """Move the drag preview and update the drop zone highlight for the latest cursor position"""
+        self._pending_motion_id = None
+        if not self.drag_data or not self.is_dragging:
+            return
+
+        x, y = self._last_motion_pos
+
+        # Motion handling only reads widget state, so existence checks can be cached
+        with cached_widget_checks():
+            inside = self._is_inside_root(x, y)
+            self._move_drag_preview(x, y, inside)
+
+            # Check for drop zones - outside the app window there are none, so skip the hit test
+            if not inside:
+                self._update_drop_zone_highlight(None)
+                return
 
-        # Bind specifically to the drag handle only with safety checks
-        if safe_widget_exists(drag_handle):
             try:
-                drag_handle.bind('<Button-1>', start_drag)
-                drag_handle.configure(cursor="hand2")
-
-                # Add hover effect to make it clear it's draggable
-                def on_enter(event):
-                    if not self.is_dragging and safe_widget_exists(drag_handle):
-                        try:
-                            drag_handle.configure(fg_color="gray40")
-                        except tk.TclError:
-                            pass
-
-                def on_leave(event):
-                    if not self.is_dragging and safe_widget_exists(drag_handle):
-                        try:
-                            drag_handle.configure(fg_color="gray30")
-                        except tk.TclError:
-                            pass
-
-                drag_handle.bind('<Enter>', on_enter)
-                drag_handle.bind('<Leave>', on_leave)
+                widget_under_cursor = self.app.root.winfo_containing(x, y)
+                # The overlay only settles at its new spot on the next idle pass, so the cursor
+                # can briefly sit over it - keep the current highlight until it has moved away
+                if widget_under_cursor is not self._drag_overlay_label:
+                    self._update_drop_zone_highlight(widget_under_cursor)
             except tk.TclError:
                 pass
 
+    def _is_inside_root(self, x: int, y: int) -> bool:
+        """Check whether a screen position lies within the app window"""
+        left, top, right, bottom = self._root_bounds
+        return left <= x < right and top <= y < bottom
+
     def _create_drag_preview(self, x: int, y: int, module_name: str):
-        """Create a visual preview of the dragged module"""
+        """Show a visual preview of the dragged module, reusing the overlay label between drags"""
+        self._drag_preview_text = f"📦 {module_name}"
+        self.drag_preview = None
         try:
-            self.drag_preview = ctk.CTkToplevel(self.app.root)
-            self.drag_preview.overrideredirect(True)
-            self.drag_preview.attributes('-alpha', 0.8)
-            self.drag_preview.geometry(f"200x40+{x + 10}+{y + 10}")
-
-            preview_label = ctk.CTkLabel(
-                self.drag_preview,
-                text=f"📦 {module_name}",
-                fg_color="blue",
-                corner_radius=5,
-                font=("Arial", 10, "bold")
-            )
-            preview_label.pack(fill="both", expand=True, padx=2, pady=2)
+            self._move_drag_preview(x, y, self._is_inside_root(x, y))
         except Exception as e:
             print(f"Error creating drag preview: {e}")
             self.drag_preview = None
 
+    def _move_drag_preview(self, x: int, y: int, inside: bool):
+        """Move the drag preview next to the cursor, hiding it while the cursor is outside the app window"""
+        if not inside:
+            self._hide_drag_preview()
+            return
+
+        try:
+            overlay = self._ensure_drag_overlay()
+            if self.drag_preview is not overlay:
+                overlay.configure(text=self._drag_preview_text)
+                overlay.lift()
+                self.drag_preview = overlay
+            left, top = self._root_bounds[:2]
+            overlay.place(x=x - left + 10, y=y - top + 10)
+        except tk.TclError:
+            pass
+
+    def _hide_drag_preview(self):
+        """Hide the drag preview so later drags can reuse it"""
+        preview = self.drag_preview
+        self.drag_preview = None
+        if not safe_widget_exists(preview):
+            return
+        try:
+            preview.place_forget()
+        except tk.TclError:
+            pass
+
+    def _ensure_drag_overlay(self) -> tk.Label:
+        """Build the in-window drag preview label the first time it's needed"""
+        if not safe_widget_exists(self._drag_overlay_label):
+            # A plain Tk label - placing a CTk widget would rescale the cursor coordinates
+            self._drag_overlay_label = tk.Label(
+                self.app.root,
+                text="",
+                bg="blue",
+                fg="white",
+                font=("Arial", 10, "bold"),
+                padx=12,
+                pady=8
+            )
+        return self._drag_overlay_label
+
     def _update_drop_zone_highlight(self, widget_under_cursor):
         """Update visual feedback for drop zones"""
+        # Find drop zone - nothing to redraw while the cursor stays over the highlighted one
+        drop_zone = self._find_drop_zone(widget_under_cursor)
+        if drop_zone is self.drop_zone_highlight:
+            return
+
         # Clear previous highlight
         if self.drop_zone_highlight and safe_widget_exists(self.drop_zone_highlight):
             try:
                 self.drop_zone_highlight.configure(fg_color=self.drop_zone_highlight._original_color)
             except (tk.TclError, AttributeError):
                 pass
-            self.drop_zone_highlight = None
-
-        # Find drop zone
-        drop_zone = self._find_drop_zone(widget_under_cursor)
+        self.drop_zone_highlight = None
 
         if drop_zone and safe_widget_exists(drop_zone):
             # Store original color and highlight
@@ -180,18 +267,34 @@ class CanvasDragDropHandler:
 
     def _find_drop_zone(self, widget) -> Optional[ctk.CTkFrame]:
         """Find the nearest valid drop zone widget"""
+        cache = self._drop_zone_cache
+        if widget in cache:
+            return cache[widget]
+
+        # Remember the result for every widget on the way up so their lookups are direct too
+        visited = []
+        drop_zone = self._walk_to_drop_zone(widget, cache, visited)
+        for walked in visited:
+            cache[walked] = drop_zone
+        return drop_zone
+
+    def _walk_to_drop_zone(self, widget, cache: Dict[Any, Optional[ctk.CTkFrame]],
+                           visited: List[Any]) -> Optional[ctk.CTkFrame]:
+        """Walk up from widget to the nearest drop zone, stopping early at an already cached ancestor"""
         current = widget
 
         while current:
+            if current in cache:
+                return cache[current]
+            visited.append(current)
+
             # Check if widget still exists
             if not safe_widget_exists(current):
-                try:
-                    current = current.master
-                    continue
-                except (tk.TclError, AttributeError):
-                    break
+                current = getattr(current, 'master', None)
+                continue
 
-            # Check if this widget has drop zone info
+            # Check if this widget has drop zone info - every tab content frame registers
+            # its info when it is built, so widgets inside a tab resolve to it on the way up
             if hasattr(current, '_drop_zone_info'):
                 return current
 
@@ -199,30 +302,7 @@ class CanvasDragDropHandler:
             if current == self.canvas_panel.modules_frame:
                 return current
 
-            # Check if this is a tab content frame
-            if isinstance(current, (ctk.CTkFrame, ctk.CTkScrollableFrame)):
-                for tab_id, tab_containers in self.canvas_panel.tab_widgets.items():
-                    for tab_name, container in tab_containers.items():
-                        if not safe_widget_exists(container):
-                            continue
-                        if current == container or is_child_of(current, container):
-                            # Add drop zone info if not present
-                            if not hasattr(current, '_drop_zone_info'):
-                                # Find the tab module
-                                for module in self.app.active_modules:
-                                    if hasattr(module, 'id') and hasattr(module, 'sub_modules') and module.id == tab_id:
-                                        current._drop_zone_info = {
-                                            'type': 'tab',
-                                            'tab_module': module,
-                                            'tab_name': tab_name
-                                        }
-                                        break
-                            return current
-
-            try:
-                current = current.master
-            except (tk.TclError, AttributeError):
-                break
+            current = getattr(current, 'master', None)
 
         return None
 
@@ -234,14 +314,16 @@ class CanvasDragDropHandler:
         dragged_module = self.drag_data['module']
         source_parent_tab = self.drag_data.get('parent_tab')
 
-        drop_zone = self._find_drop_zone(drop_target)
+        # Cache existence checks while locating the drop zone - the drop itself destroys widgets
+        with cached_widget_checks():
+            drop_zone = self._find_drop_zone(drop_target)
 
         if not drop_zone:
             return  # Invalid drop
 
         # Determine drop action
-        if hasattr(drop_zone, '_drop_zone_info'):
-            drop_info = drop_zone._drop_zone_info
+        drop_info = getattr(drop_zone, '_drop_zone_info', None)
+        if drop_info is not None:
             if drop_info['type'] == 'tab':
                 self._handle_drop_on_tab(dragged_module, drop_info['tab_module'], drop_info['tab_name'])
         elif drop_zone == self.canvas_panel.modules_frame:
@@ -272,15 +354,15 @@ class CanvasDragDropHandler:
             if 0 <= current_active_tab_index < len(target_tab_module.content_data['tabs']):
                 current_active_tab = target_tab_module.content_data['tabs'][current_active_tab_index]
 
-            if current_active_tab == tab_name:
-                # The target tab is already active, add the widget directly
-                self.canvas_panel.add_module_to_tab_widget(target_tab_module, tab_name, module)
-            else:
-                # Switch to the target tab (this will recreate all widgets including the new one)
-                target_tab_module.content_data['active_tab'] = target_tab_module.content_data['tabs'].index(tab_name)
+            # Tab content frames are cached, so the widget is added to the target tab directly
+            self.canvas_panel.add_module_to_tab_widget(target_tab_module, tab_name, module)
+
+            if current_active_tab != tab_name:
+                # Bring the target tab into view
+                target_tab_module.content_data['active_tab'] = target_tab_module.tab_index(tab_name)
                 self.canvas_panel._switch_active_tab(target_tab_module, tab_name)
 
-            self.app.set_modified(True)
+            self.canvas_panel.schedule_modified()
 
     def _handle_drop_on_main_canvas(self, module: 'Module'):
         """Handle dropping a module onto the main canvas"""
@@ -299,19 +381,22 @@ class CanvasDragDropHandler:
                 self.canvas_panel.add_module_widget(removed_module)
 
                 self.app._update_module_positions()
-                self.app.set_modified(True)
+                self.canvas_panel.schedule_modified()
 
     def _cleanup_drag(self):
         """Clean up drag and drop state with safety checks"""
         self.is_dragging = False
+        self._drop_zone_cache.clear()
 
-        if self.drag_preview:
+        if self._pending_motion_id is not None:
             try:
-                if safe_widget_exists(self.drag_preview):
-                    self.drag_preview.destroy()
-            except:
+                self.app.root.after_cancel(self._pending_motion_id)
+            except tk.TclError:
                 pass
-            self.drag_preview = None
+            self._pending_motion_id = None
+
+        if self.drag_preview:
+            self._hide_drag_preview()
 
         if self.drop_zone_highlight and safe_widget_exists(self.drop_zone_highlight):
             try:
@@ -336,13 +421,6 @@ class CanvasDragDropHandler:
                 except tk.TclError:
                     pass
 
-        # Unbind root window events
-        try:
-            self.app.root.unbind('<B1-Motion>')
-            self.app.root.unbind('<ButtonRelease-1>')
-        except tk.TclError:
-            pass
-
         self.drag_data = None
 
     def cleanup_on_canvas_clear(self):
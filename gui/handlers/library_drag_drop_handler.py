@@ -110,37 +110,17 @@ class LibraryDragDropHandler:
         try:
             widget_under_cursor = self.app.root.winfo_containing(x, y)
 
-            # Clear previous library drop highlight
-            if self.library_drop_highlight and safe_widget_exists(self.library_drop_highlight):
-                try:
-                    if hasattr(self.library_drop_highlight, '_original_library_color'):
-                        self.library_drop_highlight.configure(
-                            fg_color=self.library_drop_highlight._original_library_color)
-                    else:
-                        self.library_drop_highlight.configure(fg_color="gray15")
-                    # Clear the stored original color
-                    if hasattr(self.library_drop_highlight, '_original_library_color'):
-                        delattr(self.library_drop_highlight, '_original_library_color')
-                except tk.TclError:
-                    pass
-                self.library_drop_highlight = None
-
             # Find the appropriate drop zone
             drop_zone = self.find_library_drop_zone(widget_under_cursor)
 
-            if drop_zone and safe_widget_exists(drop_zone):
-                # Store original color and highlight
-                if not hasattr(drop_zone, '_original_library_color'):
-                    try:
-                        original_color = drop_zone.cget('fg_color')
-                        # Make sure we have a valid color (not None or empty)
-                        if original_color and original_color != '':
-                            drop_zone._original_library_color = original_color
-                        else:
-                            drop_zone._original_library_color = "gray15"
-                    except tk.TclError:
-                        drop_zone._original_library_color = "gray15"
+            # Still over the highlighted zone - nothing to recolor
+            if drop_zone is not None and drop_zone is self.library_drop_highlight:
+                return
+
+            # Clear previous library drop highlight
+            self._restore_library_highlight()
 
+            if drop_zone and safe_widget_exists(drop_zone):
                 try:
                     drop_zone.configure(fg_color="lightgreen")
                     self.library_drop_highlight = drop_zone
@@ -156,43 +136,18 @@ class LibraryDragDropHandler:
 
         while current:
             if not safe_widget_exists(current):
-                try:
-                    current = current.master
-                    continue
-                except (tk.TclError, AttributeError):
-                    break
+                current = getattr(current, 'master', None)
+                continue
 
             # Check if this is the main modules frame (for main canvas drops)
             if current == self.canvas_panel.modules_frame:
                 return current
 
-            # Check if this is a tab content frame
+            # Check if this is a tab content frame - widgets inside a tab resolve to it on the way up
             if hasattr(current, '_drop_zone_info'):
                 return current
 
-            # Check if this is a tab content container
-            for tab_id, tab_containers in self.canvas_panel.tab_widgets.items():
-                for tab_name, container in tab_containers.items():
-                    if not safe_widget_exists(container):
-                        continue
-                    if current == container or is_child_of(current, container):
-                        # Add drop zone info if not present
-                        if not hasattr(current, '_drop_zone_info'):
-                            # Find the tab module
-                            for module in self.app.active_modules:
-                                if hasattr(module, 'sub_modules') and module.id == tab_id:
-                                    current._drop_zone_info = {
-                                        'type': 'tab',
-                                        'tab_module': module,
-                                        'tab_name': tab_name
-                                    }
-                                    break
-                        return current
-
-            try:
-                current = current.master
-            except (tk.TclError, AttributeError):
-                break
+            current = getattr(current, 'master', None)
 
         return None
 
@@ -216,9 +171,9 @@ class LibraryDragDropHandler:
             return False
 
         # Determine where to add the module
-        if hasattr(drop_zone, '_drop_zone_info'):
+        drop_info = getattr(drop_zone, '_drop_zone_info', None)
+        if drop_info is not None:
             # Dropping on a tab
-            drop_info = drop_zone._drop_zone_info
             if drop_info['type'] == 'tab':
                 # Set the tab context and add the module
                 self.app.selected_tab_context = (drop_info['tab_module'], drop_info['tab_name'])
@@ -233,24 +188,19 @@ class LibraryDragDropHandler:
 
         return False
 
-    def clear_library_drop_highlight(self):
-        """Clear library drop highlighting"""
+    def _restore_library_highlight(self):
+        """Return the highlighted drop zone to the color recorded when it was created"""
         if self.library_drop_highlight and safe_widget_exists(self.library_drop_highlight):
             try:
-                if hasattr(self.library_drop_highlight, '_original_library_color'):
-                    original_color = self.library_drop_highlight._original_library_color
-                    # Make sure we have a valid color
-                    if original_color and original_color != '':
-                        self.library_drop_highlight.configure(fg_color=original_color)
-                    else:
-                        self.library_drop_highlight.configure(fg_color="gray15")
-                    # Clean up the stored color
-                    delattr(self.library_drop_highlight, '_original_library_color')
-                else:
-                    self.library_drop_highlight.configure(fg_color="gray15")
-            except (tk.TclError, AttributeError):
+                self.library_drop_highlight.configure(
+                    fg_color=getattr(self.library_drop_highlight, '_original_color', "gray15"))
+            except tk.TclError:
                 pass
-            self.library_drop_highlight = None
+        self.library_drop_highlight = None
+
+    def clear_library_drop_highlight(self):
+        """Clear library drop highlighting"""
+        self._restore_library_highlight()
 
         # Also clear canvas highlighting
         self.highlight_canvas_as_drop_zone(False)
@@ -1269,7 +1269,7 @@ class PropertiesPanel:
 
         # List modules in this tab
         if tab_name in tab_module.sub_modules:
-            modules = sorted(tab_module.sub_modules[tab_name], key=lambda m: m.position)
+            modules = tab_module.sub_modules[tab_name]
             if modules:
                 for i, module in enumerate(modules):
                     self._create_module_list_item(modules_container, module, i + 1, tab_module, tab_name)
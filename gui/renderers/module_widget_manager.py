@@ -8,18 +8,101 @@ UI interactions like selection and previews.
 """
 
 import customtkinter as ctk
-from typing import Dict, Optional, Tuple, TYPE_CHECKING
+from functools import lru_cache, partial
+from typing import Any, Dict, List, Optional, Set, Tuple, Union, TYPE_CHECKING
 import tkinter as tk
 import os
+from gui.utils.bindings import add_bindtag, find_tagged_ancestor
 
 if TYPE_CHECKING:
     from modules.base_module import Module
     from modules.complex_module import TabModule
 
 
+# Key for a module widget nested in a tab - (tab_module_id, tab_name, module_id)
+NestedWidgetKey = Tuple[str, str, str]
+
+# Bind tag shared by the clickable parts of every module header
+MODULE_HEADER_TAG = "ModuleHeader"
+
+# Content fields that feed the canvas preview text
+_PREVIEW_FIELDS = ('title', 'content', 'source', 'label', 'issue_title', 'organization')
+
+# Preview text templates and their field defaults keyed by module type
+_PREVIEW_TEMPLATES = {
+    'header': ("📄 {title}", {'title': 'Header'}),
+    'text': ("📝 {content}", {'content': ''}),
+    'media': ("🖼️ Media: {source}", {'source': 'No source'}),
+    'table': ("📊 Table: {title}", {'title': 'Untitled'}),
+    'disclaimer': ("⚠️ {label}", {'label': 'Disclaimer'}),
+    'section_title': ("📌 {title}", {'title': 'Section'}),
+    'issue_card': ("❗ {issue_title}", {'issue_title': 'Issue'}),
+    'footer': ("📍 Footer - {organization}", {'organization': 'Organization'}),
+    'tabs': ("📑 Tab Section ({tab_count} tabs)", {'tab_count': 0}),
+}
+
+# Removed top-level module frames kept around for reuse by the next added modules
+_MAX_SPARE_FRAMES = 8
+
+# Text previews are cut at this many characters
+_TEXT_PREVIEW_LENGTH = 100
+
+
+def _preview_key(content_data: Dict[str, Any]) -> Tuple:
+    """Build a hashable snapshot of the content fields used for preview text"""
+    items = []
+    for field in _PREVIEW_FIELDS:
+        if field not in content_data:
+            continue
+        value = content_data[field]
+        if field == 'content' and isinstance(value, str):
+            value = value[:_TEXT_PREVIEW_LENGTH]
+        try:
+            hash(value)
+        except TypeError:
+            continue
+        items.append((field, value))
+    if 'tabs' in content_data:
+        items.append(('tab_count', len(content_data['tabs'])))
+    return tuple(items)
+
+
+@lru_cache(maxsize=512)
+def _preview_for(module_type: str, key: Tuple) -> str:
+    """Format preview text for a module type from a content snapshot"""
+    template, defaults = _PREVIEW_TEMPLATES[module_type]
+    values = {**defaults, **dict(key)}
+    text = template.format_map(values)
+
+    # Mark text previews that reach the length limit
+    if module_type == 'text' and len(values['content']) >= _TEXT_PREVIEW_LENGTH:
+        text += "..."
+    return text
+
+
+def preview_text(module: 'Module') -> str:
+    """Get canvas preview text for a module - safe to call off the UI thread"""
+    if module.module_type not in _PREVIEW_TEMPLATES:
+        return f"{module.display_name}"
+    return _preview_for(module.module_type, _preview_key(module.content_data))
+
+
 class ModuleWidgetManager:
     """Manages the creation and lifecycle of individual module widgets"""
 
+    __slots__ = (
+        'modules_frame',
+        'app',
+        'drag_drop_handler',
+        '_safe_widget_exists',
+        '_safe_destroy_widget',
+        'module_widgets',
+        'selected_widget',
+        'nested_widget_keys',
+        'preview_labels',
+        '_spare_frames',
+    )
+
     def __init__(self, modules_frame: ctk.CTkFrame, app_instance, drag_drop_handler,
                  safe_widget_exists_func, safe_destroy_widget_func):
         """
@@ -38,10 +121,22 @@ class ModuleWidgetManager:
         self._safe_widget_exists = safe_widget_exists_func
         self._safe_destroy_widget = safe_destroy_widget_func
 
-        # Widget tracking
-        self.module_widgets: Dict[str, ctk.CTkFrame] = {}
+        # Widget tracking - module_id for top-level modules, NestedWidgetKey for modules in tabs
+        self.module_widgets: Dict[Union[str, NestedWidgetKey], ctk.CTkFrame] = {}
         self.selected_widget: Optional[ctk.CTkFrame] = None
 
+        # Nested widget keys per tab - tab_module_id -> {tab_name -> {NestedWidgetKey}}
+        self.nested_widget_keys: Dict[str, Dict[str, Set[NestedWidgetKey]]] = {}
+
+        # Direct references to each module's preview label - module_id -> label
+        self.preview_labels: Dict[str, ctk.CTkLabel] = {}
+
+        # Unpacked frames of removed top-level modules, rewired instead of rebuilt for new modules
+        self._spare_frames: List[ctk.CTkFrame] = []
+
+        # One class binding serves the header clicks of all module frames
+        self.modules_frame.bind_class(MODULE_HEADER_TAG, "<Button-1>", self._on_header_click)
+
     def add_module_widget(self, module: 'Module', with_nested: bool = False):
         """Add visual representation of module"""
         # Create main module frame
@@ -60,10 +155,43 @@ class ModuleWidgetManager:
         # Make frame draggable using the drag drop handler
         self.drag_drop_handler.enable_drag_drop(module_frame, module)
 
+    @staticmethod
+    def widget_key(module_id: str,
+                   parent_tab: Optional[Tuple['TabModule', str]] = None) -> Union[str, NestedWidgetKey]:
+        """Key of a module's widget in module_widgets - the module id, or a tuple for modules in tabs"""
+        if parent_tab is None:
+            return module_id
+        return parent_tab[0].id, parent_tab[1], module_id
+
+    def add_nested_widget(self, widget_key: NestedWidgetKey, module_frame: ctk.CTkFrame):
+        """Track the widget of a module nested in a tab"""
+        self.module_widgets[widget_key] = module_frame
+        self.nested_widget_keys.setdefault(widget_key[0], {}).setdefault(widget_key[1], set()).add(widget_key)
+
+    def pop_nested_widget(self, widget_key: NestedWidgetKey) -> Optional[ctk.CTkFrame]:
+        """Stop tracking the widget of a module nested in a tab and return it"""
+        keys = self.nested_widget_keys.get(widget_key[0], {}).get(widget_key[1])
+        if keys is not None:
+            keys.discard(widget_key)
+        return self.module_widgets.pop(widget_key, None)
+
+    def nested_keys_in_tab(self, tab_module_id: str, tab_name: str) -> List[NestedWidgetKey]:
+        """Keys of the module widgets currently tracked in one tab"""
+        return list(self.nested_widget_keys.get(tab_module_id, {}).get(tab_name, ()))
+
+    def pop_tab_module_keys(self, tab_module_id: str) -> List[NestedWidgetKey]:
+        """Stop indexing the nested widgets of a tab module and return their keys"""
+        tabs = self.nested_widget_keys.pop(tab_module_id, {})
+        return [key for keys in tabs.values() for key in keys]
+
     def create_module_frame(self, module: 'Module', is_top_level: bool = True,
                             parent_tab: Optional[Tuple['TabModule', str]] = None,
                             parent_widget: Optional[ctk.CTkFrame] = None) -> ctk.CTkFrame:
         """Create a frame for a module"""
+        # Plain top-level frames only differ in their module, so a spare one just gets rewired
+        if is_top_level and parent_widget is None and self._spare_frames and not hasattr(module, 'sub_modules'):
+            return self._reuse_module_frame(self._spare_frames.pop(), module)
+
         # Use different styling for nested modules
         frame_color = "gray15" if is_top_level else "gray18"
         border_color = "gray15" if is_top_level else "gray20"
@@ -84,6 +212,7 @@ class ModuleWidgetManager:
         # Store module reference in the frame
         module_frame._module = module
         module_frame._parent_tab = parent_tab
+        module_frame._is_top_level = is_top_level
 
         # Create header with module type and controls
         header_frame = ctk.CTkFrame(module_frame, fg_color="gray20", height=30)
@@ -118,46 +247,26 @@ class ModuleWidgetManager:
             font=("Arial", 12, "bold")
         )
         type_label.pack(side="left", padx=10)
+        module_frame._type_label = type_label
+
+        # The drag handle is re-packed in front of this label when leaving preview mode
+        module_frame._drag_handle_anchor = type_label if is_top_level else indent_label
 
         # Control buttons frame (created before event binding)
         controls_frame = ctk.CTkFrame(header_frame, fg_color="gray20")
         controls_frame.pack(side="right", padx=5)
 
-        # Enhanced click handling - make entire header clickable
-        def on_header_click(event):
-            # Don't trigger selection if clicking on drag handle or buttons
-            clicked_widget = event.widget
+        # Keep header references so preview mode can toggle the editing controls directly
+        module_frame._header_frame = header_frame
+        module_frame._controls_frame = controls_frame
 
-            # Check if we clicked on the drag handle
-            if clicked_widget == drag_handle:
-                return
-
-            # Check if we clicked on a button (control buttons)
-            if isinstance(clicked_widget, ctk.CTkButton):
-                return
-
-            # Check if the clicked widget is inside the controls frame
-            current = clicked_widget
-            while current and current != header_frame:
-                if current == controls_frame:
-                    return  # Don't select if clicking in controls area
-                try:
-                    current = current.master
-                except:
-                    break
-
-            # Safe to trigger selection
-            if is_top_level:  # Only clear context when clicking main canvas modules
-                self._clear_tab_context()
-            self._safe_select_module_click(module, parent_tab)
-
-        # Bind click to multiple areas for better UX
-        type_label.bind("<Button-1>", on_header_click)
-        header_frame.bind("<Button-1>", on_header_click)
+        # Make the header clickable - the drag handle and controls stay untagged
+        add_bindtag(type_label, MODULE_HEADER_TAG)
+        add_bindtag(header_frame, MODULE_HEADER_TAG)
 
         # Also make indent label clickable for nested modules
         if not is_top_level:
-            indent_label.bind("<Button-1>", on_header_click)
+            add_bindtag(indent_label, MODULE_HEADER_TAG)
 
         # Context-specific controls
         if not is_top_level and parent_tab:
@@ -167,8 +276,7 @@ class ModuleWidgetManager:
                 text="↗",
                 width=25,
                 height=25,
-                command=lambda m=module, pt0=parent_tab[0], pt1=parent_tab[1]:
-                self._safe_move_module_from_tab(m, pt0, pt1)
+                command=partial(self._safe_move_module_from_tab, module, parent_tab[0], parent_tab[1])
             )
             move_out_btn.pack(side="left", padx=2)
 
@@ -178,7 +286,7 @@ class ModuleWidgetManager:
             text="↑",
             width=25,
             height=25,
-            command=lambda: self._safe_move_module_up(module, parent_tab)
+            command=partial(self._safe_move_module_up, module, parent_tab)
         )
         up_btn.pack(side="left", padx=2)
 
@@ -187,7 +295,7 @@ class ModuleWidgetManager:
             text="↓",
             width=25,
             height=25,
-            command=lambda: self._safe_move_module_down(module, parent_tab)
+            command=partial(self._safe_move_module_down, module, parent_tab)
         )
         down_btn.pack(side="left", padx=2)
 
@@ -199,9 +307,10 @@ class ModuleWidgetManager:
             height=25,
             fg_color="darkred",
             hover_color="red",
-            command=lambda mid=module.id: self._safe_remove_module(mid)
+            command=partial(self._safe_remove_module, module.id)
         )
         delete_btn.pack(side="left", padx=2)
+        module_frame._control_buttons = (up_btn, down_btn, delete_btn)
 
         # Content preview
         preview_frame = ctk.CTkFrame(module_frame, fg_color="gray10")
@@ -209,9 +318,69 @@ class ModuleWidgetManager:
 
         # Add module preview content
         self.create_module_preview(preview_frame, module)
+        module_frame._preview_label = self.preview_labels[module.id]
+
+        return module_frame
+
+    def _reuse_module_frame(self, module_frame: ctk.CTkFrame, module: 'Module') -> ctk.CTkFrame:
+        """Point a spare top-level module frame at a new module"""
+        module_frame._module = module
+
+        # Drop any selection or drag coloring left from the previous module
+        module_frame.configure(fg_color="gray15", border_color="gray15")
+        module_frame._type_label.configure(text=module.display_name)
+
+        up_btn, down_btn, delete_btn = module_frame._control_buttons
+        up_btn.configure(command=partial(self._safe_move_module_up, module, None))
+        down_btn.configure(command=partial(self._safe_move_module_down, module, None))
+        delete_btn.configure(command=partial(self._safe_remove_module, module.id))
+
+        preview_label = module_frame._preview_label
+        new_text = self.get_preview_text(module)
+        if new_text != preview_label._preview_text:
+            preview_label.configure(text=new_text)
+            preview_label._preview_text = new_text
+        preview_label._preview_version = self._preview_version(module)
+        self.preview_labels[module.id] = preview_label
 
         return module_frame
 
+    def _recycle_module_frame(self, module_frame: ctk.CTkFrame) -> bool:
+        """Keep a removed plain top-level frame for reuse, returning False if it should be destroyed"""
+        if (len(self._spare_frames) >= _MAX_SPARE_FRAMES or
+                not module_frame._is_top_level or
+                hasattr(module_frame._module, 'sub_modules') or
+                not self._safe_widget_exists(module_frame)):
+            return False
+
+        try:
+            module_frame.pack_forget()
+        except tk.TclError:
+            return False
+        self._spare_frames.append(module_frame)
+        return True
+
+    def _drop_spare_frames(self):
+        """Destroy the spare module frames"""
+        for module_frame in self._spare_frames:
+            self._safe_destroy_widget(module_frame)
+        self._spare_frames.clear()
+
+    def _on_header_click(self, event):
+        """Select the module whose header was clicked"""
+        if self.drag_drop_handler.is_dragging:
+            return
+
+        # Walk up from the clicked widget to the nearest module frame
+        current = find_tagged_ancestor(event.widget, '_module')
+        if current is None:
+            return
+
+        # Only clear context when clicking main canvas modules
+        if current._is_top_level:
+            self._clear_tab_context()
+        self._safe_select_module_click(current._module, current._parent_tab)
+
     def create_module_preview(self, parent: ctk.CTkFrame, module: 'Module'):
         """Create preview of module content"""
         # Create a simplified preview based on module type
@@ -227,140 +396,169 @@ class ModuleWidgetManager:
         )
         preview_label.pack(fill="both", expand=True, padx=10, pady=10)
 
+        # Keep a direct reference so preview updates don't have to search the widget tree
+        preview_label._preview_version = self._preview_version(module)
+        preview_label._preview_text = preview_text
+        self.preview_labels[module.id] = preview_label
+
+    @staticmethod
+    def _preview_version(module: 'Module') -> Tuple[int, int]:
+        """Version of the module state shown by its preview label"""
+        return module.content_version, module.structure_version
+
     def get_preview_text(self, module: 'Module') -> str:
         """Get preview text for module"""
-        if module.module_type == 'header':
-            return f"📄 {module.content_data.get('title', 'Header')}"
-        elif module.module_type == 'text':
-            content = module.content_data.get('content', '')[:100]
-            return f"📝 {content}..." if len(content) >= 100 else f"📝 {content}"
-        elif module.module_type == 'media':
-            return f"🖼️ Media: {module.content_data.get('source', 'No source')}"
-        elif module.module_type == 'table':
-            return f"📊 Table: {module.content_data.get('title', 'Untitled')}"
-        elif module.module_type == 'disclaimer':
-            return f"⚠️ {module.content_data.get('label', 'Disclaimer')}"
-        elif module.module_type == 'section_title':
-            return f"📌 {module.content_data.get('title', 'Section')}"
-        elif module.module_type == 'issue_card':
-            return f"❗ {module.content_data.get('issue_title', 'Issue')}"
-        elif module.module_type == 'footer':
-            return f"📍 Footer - {module.content_data.get('organization', 'Organization')}"
-        elif module.module_type == 'tabs':
-            tab_count = len(module.content_data.get('tabs', []))
-            return f"📑 Tab Section ({tab_count} tabs)"
-        else:
-            return f"{module.display_name}"
+        return preview_text(module)
 
     def update_module_preview(self, module: 'Module'):
         """Update the preview for a specific module"""
-        if module.id in self.module_widgets:
-            widget = self.module_widgets[module.id]
-            if not self._safe_widget_exists(widget):
-                return
-
-            # Find and update the preview label
+        preview_label = self.preview_labels.get(module.id)
+        if preview_label is None:
+            return
+
+        # Nothing to redraw if the module hasn't changed since the label was last set
+        version = self._preview_version(module)
+        if preview_label._preview_version == version:
+            return
+
+        # Edits to fields the preview doesn't show leave the text as it was
+        new_text = self.get_preview_text(module)
+        if new_text != preview_label._preview_text:
             try:
-                for child in widget.winfo_children():
-                    if isinstance(child, ctk.CTkFrame) and self._safe_widget_exists(child):
-                        for grandchild in child.winfo_children():
-                            if (isinstance(grandchild, ctk.CTkLabel) and
-                                    self._safe_widget_exists(grandchild) and
-                                    grandchild.cget("font") == ("Arial", 11)):
-                                try:
-                                    grandchild.configure(text=self.get_preview_text(module))
-                                except tk.TclError:
-                                    pass
-                                break
+                preview_label.configure(text=new_text)
             except tk.TclError:
-                pass
+                # The label is gone - drop the stale reference
+                del self.preview_labels[module.id]
+                return
+            preview_label._preview_text = new_text
+        preview_label._preview_version = version
 
     def highlight_module(self, module: 'Module'):
         """Highlight the selected module"""
+        widget = self.module_widgets.get(module.id)
+
+        # Already highlighted - nothing to recolor
+        if widget is not None and widget is self.selected_widget:
+            return
+
         # Remove previous highlight
-        if self.selected_widget and self._safe_widget_exists(self.selected_widget):
-            try:
-                self.selected_widget.configure(border_color=("gray15", "gray15"))
-            except tk.TclError:
-                pass
-            finally:
-                self.selected_widget = None
+        if self._safe_widget_exists(self.selected_widget):
+            self.selected_widget.configure(border_color=("gray15", "gray15"))
+        self.selected_widget = None
 
-        # Add highlight to selected module
-        if module.id in self.module_widgets:
-            widget = self.module_widgets[module.id]
-            if self._safe_widget_exists(widget):
-                try:
-                    widget.configure(border_color="blue")
-                    self.selected_widget = widget
-                except tk.TclError:
-                    if module.id in self.module_widgets:
-                        del self.module_widgets[module.id]
+        # Add highlight to selected module, dropping the reference if its widget is gone
+        if self._safe_widget_exists(widget):
+            widget.configure(border_color="blue")
+            self.selected_widget = widget
+        elif widget is not None:
+            self.module_widgets.pop(module.id, None)
 
     def remove_module_widget(self, module_id: str):
         """Remove module widget from canvas"""
-        if module_id in self.module_widgets:
-            widget = self.module_widgets[module_id]
-
+        widget = self.module_widgets.pop(module_id, None)
+        if widget is not None:
             # Clear selection if this widget is currently selected
             if self.selected_widget == widget:
                 self.selected_widget = None
 
-            self._safe_destroy_widget(widget)
-            del self.module_widgets[module_id]
+            if not self._recycle_module_frame(widget):
+                self._safe_destroy_widget(widget)
+            self.preview_labels.pop(module_id, None)
 
             # Also clean up any tab-related widgets for this module
-            keys_to_remove = [key for key in self.module_widgets.keys() if key.startswith(f"{module_id}:")]
-            for key in keys_to_remove:
-                widget = self.module_widgets[key]
+            for key in self.pop_tab_module_keys(module_id):
+                widget = self.module_widgets.pop(key, None)
+                if widget is None:
+                    continue
                 if self.selected_widget == widget:
                     self.selected_widget = None
                 self._safe_destroy_widget(widget)
-                del self.module_widgets[key]
 
     def clear_all_widgets(self):
         """Clear all module widgets"""
         self.selected_widget = None
 
-        # Destroy all widgets safely
-        widgets_to_destroy = list(self.module_widgets.values())
+        # Destroy top-level widgets that still exist - nested module frames go with their tab module
+        widgets_to_destroy = [widget for key, widget in self.module_widgets.items()
+                              if isinstance(key, str) and self._safe_widget_exists(widget)]
         for widget in widgets_to_destroy:
             self._safe_destroy_widget(widget)
+        self._drop_spare_frames()
+
+        self.forget_all_widgets()
+
+    def forget_all_widgets(self):
+        """Drop all widget references without destroying the widgets"""
+        self.selected_widget = None
 
-        # Clear tracking dictionary
+        # Clear tracking dictionaries
         self.module_widgets.clear()
+        self.nested_widget_keys.clear()
+        self.preview_labels.clear()
+        self._spare_frames.clear()
 
     def refresh_widget_order(self):
         """Refresh the visual order of modules"""
-        modules = sorted(self.app.active_modules, key=lambda m: m.position)
+        modules = self.app.active_modules
 
+        # Collect the widgets in their new order before touching the layout
+        widgets = []
         for module in modules:
-            if module.id in self.module_widgets:
-                widget = self.module_widgets[module.id]
-                if self._safe_widget_exists(widget):
-                    try:
-                        widget.pack_forget()
-                        widget.pack(fill="x", padx=5, pady=5)
-                    except tk.TclError:
-                        pass
+            widget = self.module_widgets.get(module.id)
+            if widget is not None:
+                widgets.append(widget)
+
+        try:
+            if self.modules_frame.pack_slaves() == widgets:
+                return
+        except tk.TclError:
+            pass
+
+        # Unpack everything, then re-pack in order
+        for widget in widgets:
+            try:
+                widget.pack_forget()
+            except tk.TclError:
+                pass
+        for module in modules:
+            widget = self.module_widgets.get(module.id)
+            if widget is None:
+                continue
+            try:
+                widget.pack(fill="x", padx=5, pady=5)
+            except tk.TclError:
+                # The widget is gone - drop the stale references
+                self.module_widgets.pop(module.id, None)
+                self.preview_labels.pop(module.id, None)
 
     def set_preview_mode(self, enabled: bool):
         """Toggle between edit and preview modes"""
-        for widget in self.module_widgets.values():
-            if not self._safe_widget_exists(widget):
-                continue
+        # Dead widgets raise TclError on the first call, so there's no separate existence check
+        dead_keys = []
+
+        # Spare frames keep the headers of the mode they were removed in
+        self._drop_spare_frames()
 
+        # Toggle every header
+        for key, widget in self.module_widgets.items():
             try:
                 if enabled:
-                    for child in widget.winfo_children():
-                        if isinstance(child, ctk.CTkFrame) and self._safe_widget_exists(child):
-                            for grandchild in child.winfo_children():
-                                if isinstance(grandchild, ctk.CTkFrame) and self._safe_widget_exists(grandchild):
-                                    grandchild.pack_forget()
-                else:
-                    self.refresh_widget_order()
+                    # Hide drag handle and control buttons
+                    widget._drag_handle.pack_forget()
+                    widget._controls_frame.pack_forget()
+                elif not widget._drag_handle.winfo_manager():
+                    # Restore them at their original place in the header
+                    widget._drag_handle.pack(side="left", padx=(5, 5), pady=2,
+                                             before=widget._drag_handle_anchor)
+                    widget._controls_frame.pack(side="right", padx=5)
             except tk.TclError:
-                pass
+                dead_keys.append(key)
+
+        for key in dead_keys:
+            if isinstance(key, tuple):
+                self.pop_nested_widget(key)
+            else:
+                self.module_widgets.pop(key, None)
 
     # Delegate methods - these call back to the main canvas panel or app
     def _clear_tab_context(self):
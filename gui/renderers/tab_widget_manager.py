@@ -8,6 +8,7 @@ drop zones, and coordinating tab-related UI interactions.
 """
 
 import customtkinter as ctk
+from functools import partial
 from typing import Dict, Optional, Tuple, TYPE_CHECKING
 import tkinter as tk
 
@@ -16,9 +17,27 @@ if TYPE_CHECKING:
     from modules.complex_module import TabModule
 
 
+# Events bound on every tab content frame by _enable_tab_drop_zone
+_DROP_ZONE_EVENTS = ("<Button-1>", "<Enter>", "<Leave>")
+
+
 class TabWidgetManager:
     """Manages the creation and lifecycle of tab module widgets and their content"""
 
+    __slots__ = (
+        'app',
+        'module_widget_manager',
+        'library_drag_drop_handler',
+        '_safe_widget_exists',
+        '_safe_destroy_widget',
+        'tab_widgets',
+        'tab_content_frames',
+        'tab_containers',
+        'tab_selectors',
+        'tab_buttons',
+        'shown_tabs',
+    )
+
     def __init__(self, app_instance, module_widget_manager, library_drag_drop_handler,
                  safe_widget_exists_func, safe_destroy_widget_func):
         """
@@ -40,6 +59,19 @@ class TabWidgetManager:
         # Tab widget tracking - tab_module_id -> {tab_name -> frame}
         self.tab_widgets: Dict[str, Dict[str, ctk.CTkFrame]] = {}
 
+        # Cached per-tab content frames - tab_module_id -> {tab_name -> content frame}
+        self.tab_content_frames: Dict[str, Dict[str, ctk.CTkFrame]] = {}
+
+        # Direct references to each tab module's container and selector frames
+        self.tab_containers: Dict[str, ctk.CTkFrame] = {}
+        self.tab_selectors: Dict[str, ctk.CTkFrame] = {}
+
+        # Tab selector buttons - tab_module_id -> {tab_name -> button}
+        self.tab_buttons: Dict[str, Dict[str, ctk.CTkButton]] = {}
+
+        # Tab whose content frame is currently packed - tab_module_id -> tab_name
+        self.shown_tabs: Dict[str, str] = {}
+
     def create_tab_content_areas(self, tab_module: 'TabModule', parent_frame: ctk.CTkFrame,
                                  with_nested: bool = False):
         """Create visual areas for tab content with proper module display"""
@@ -49,6 +81,7 @@ class TabWidgetManager:
 
         # Store reference to the tab container for easy access
         tab_container._tab_module_id = tab_module.id
+        self.tab_containers[tab_module.id] = tab_container
 
         # Initialize storage for this tab module
         if tab_module.id not in self.tab_widgets:
@@ -61,6 +94,7 @@ class TabWidgetManager:
 
         # Store reference for easy access
         tab_container._tab_selector_frame = tab_selector_frame
+        self.tab_selectors[tab_module.id] = tab_selector_frame
 
         # Create content area container (this will hold the switchable content)
         content_area = ctk.CTkFrame(tab_container, fg_color="gray18")
@@ -69,35 +103,22 @@ class TabWidgetManager:
         # Store reference for easy access
         tab_container._content_area = content_area
 
-        # Create tab content frames for ALL tabs (but only show the active one)
-        self._create_all_tab_content_frames(tab_module, content_area, with_nested)
+        # Build only the active tab's content - other tabs are built the first time they're shown
+        self._create_active_tab_content_frame(tab_module, content_area, with_nested)
 
-        # Create/update tab buttons
-        self._update_tab_buttons(tab_module, tab_selector_frame)
-
-    def _update_tab_buttons(self, tab_module: 'TabModule', tab_selector_frame: ctk.CTkFrame):
-        """Update tab buttons with current active state"""
-        # Clear existing buttons
-        for widget in tab_selector_frame.winfo_children():
-            if self._safe_widget_exists(widget):
-                self._safe_destroy_widget(widget)
+        # Create tab buttons
+        self._create_tab_buttons(tab_module, tab_selector_frame)
 
+    def _create_tab_buttons(self, tab_module: 'TabModule', tab_selector_frame: ctk.CTkFrame):
+        """Create tab buttons with current active state in a freshly created selector frame"""
         active_tab_index = tab_module.content_data.get('active_tab', 0)
+        buttons = self.tab_buttons[tab_module.id] = {}
 
         # Create tab buttons
         for i, tab_name in enumerate(tab_module.content_data['tabs']):
-            is_active = (i == active_tab_index)
-
-            tab_btn = ctk.CTkButton(
-                tab_selector_frame,
-                text=tab_name,
-                width=100,
-                height=25,
-                fg_color="gray30" if is_active else "gray40",
-                hover_color="gray35" if is_active else "gray45",
-                command=lambda tn=tab_name, tm=tab_module: self._safe_on_tab_click(tm, tn)
-            )
+            tab_btn = self._create_tab_button(tab_module, tab_selector_frame, tab_name, i == active_tab_index)
             tab_btn.pack(side="left", padx=2, pady=4)
+            buttons[tab_name] = tab_btn
 
         # Add "+" button to add new tab
         add_tab_btn = ctk.CTkButton(
@@ -107,78 +128,110 @@ class TabWidgetManager:
             height=25,
             fg_color="green",
             hover_color="darkgreen",
-            command=lambda: self._safe_add_new_tab(tab_module)
+            command=partial(self._safe_add_new_tab, tab_module)
         )
         add_tab_btn.pack(side="left", padx=2)
+        tab_selector_frame._add_tab_button = add_tab_btn
+
+    def _create_tab_button(self, tab_module: 'TabModule', tab_selector_frame: ctk.CTkFrame,
+                           tab_name: str, is_active: bool) -> ctk.CTkButton:
+        """Create the (unpacked) selector button for a single tab"""
+        return ctk.CTkButton(
+            tab_selector_frame,
+            text=tab_name,
+            width=100,
+            height=25,
+            fg_color="gray30" if is_active else "gray40",
+            hover_color="gray35" if is_active else "gray45",
+            command=partial(self._safe_on_tab_click, tab_module, tab_name)
+        )
 
-    def _create_all_tab_content_frames(self, tab_module: 'TabModule', content_area: ctk.CTkFrame,
-                                       with_nested: bool = False):
-        """Create content frames for all tabs in the module"""
+    def _append_tab_button(self, tab_module: 'TabModule', tab_name: str) -> bool:
+        """Add the selector button of a newly added tab in front of the "+" button"""
+        tab_selector_frame = self.tab_selectors.get(tab_module.id)
+        if not self._safe_widget_exists(tab_selector_frame):
+            return False
+
+        tab_btn = self._create_tab_button(tab_module, tab_selector_frame, tab_name, is_active=False)
+        tab_btn.pack(side="left", padx=2, pady=4, before=tab_selector_frame._add_tab_button)
+        self.tab_buttons.setdefault(tab_module.id, {})[tab_name] = tab_btn
+        return True
+
+    def _create_active_tab_content_frame(self, tab_module: 'TabModule', content_area: ctk.CTkFrame,
+                                         with_nested: bool = False):
+        """Create and show the content frame for the module's active tab"""
+        tabs = tab_module.content_data['tabs']
         active_tab_index = tab_module.content_data.get('active_tab', 0)
+        if not 0 <= active_tab_index < len(tabs):
+            return
 
-        for i, tab_name in enumerate(tab_module.content_data['tabs']):
-            # Create content frame for this tab
-            tab_content_frame = ctk.CTkFrame(
-                content_area,
-                fg_color="gray15",
-                border_width=1,
-                border_color="gray20"
-            )
+        tab_name = tabs[active_tab_index]
+        tab_content_frame = self._build_tab_content_frame(tab_module, content_area, tab_name, with_nested)
+        tab_content_frame.pack(fill="both", expand=True, padx=5, pady=5)
+        self.shown_tabs[tab_module.id] = tab_name
+
+    def _build_tab_content_frame(self, tab_module: 'TabModule', content_area: ctk.CTkFrame,
+                                 tab_name: str, with_nested: bool = False) -> ctk.CTkFrame:
+        """Build the (unpacked) content frame for a single tab and cache it"""
+        # Create content frame for this tab
+        tab_content_frame = ctk.CTkFrame(
+            content_area,
+            fg_color="gray15",
+            border_width=1,
+            border_color="gray20"
+        )
 
-            # Only pack the active tab initially
-            if i == active_tab_index:
-                tab_content_frame.pack(fill="both", expand=True, padx=5, pady=5)
+        # Store the tab content frame
+        tab_content_frame._tab_name = tab_name
+        tab_content_frame._tab_module_id = tab_module.id
+        self.tab_content_frames.setdefault(tab_module.id, {})[tab_name] = tab_content_frame
 
-            # Store the tab content frame
-            tab_content_frame._tab_name = tab_name
-            tab_content_frame._tab_module_id = tab_module.id
+        # Enable drop zone for this tab (including library drops)
+        self._enable_tab_drop_zone(tab_content_frame, tab_module, tab_name)
 
-            # Enable drop zone for this tab (including library drops)
-            self._enable_tab_drop_zone(tab_content_frame, tab_module, tab_name)
+        # Header label for the tab content with better instructions
+        header_text, subheader_text = self._tab_header_texts(tab_module, tab_name)
 
-            # Header label for the tab content with better instructions
-            module_count = len(tab_module.sub_modules.get(tab_name, []))
-            if module_count > 0:
-                header_text = f"'{tab_name}' tab ({module_count} modules)"
-                subheader_text = "Drag modules here or click to add new ones"
-            else:
-                header_text = f"'{tab_name}' tab - Empty"
-                subheader_text = "Drag modules from left panel or click to select this tab"
-
-            header_label = ctk.CTkLabel(
-                tab_content_frame,
-                text=header_text,
-                font=("Arial", 12, "bold"),
-                text_color="white"
-            )
-            header_label.pack(pady=(10, 2))
-
-            # Add instructional subheader
-            subheader_label = ctk.CTkLabel(
-                tab_content_frame,
-                text=subheader_text,
-                font=("Arial", 10),
-                text_color="gray"
-            )
-            subheader_label.pack(pady=(0, 5))
+        header_label = ctk.CTkLabel(
+            tab_content_frame,
+            text=header_text,
+            font=("Arial", 12, "bold"),
+            text_color="white"
+        )
+        header_label.pack(pady=(10, 2))
+
+        # Add instructional subheader
+        subheader_label = ctk.CTkLabel(
+            tab_content_frame,
+            text=subheader_text,
+            font=("Arial", 10),
+            text_color="gray"
+        )
+        subheader_label.pack(pady=(0, 5))
 
-            # Container for modules in this tab
-            modules_container = ctk.CTkScrollableFrame(tab_content_frame, fg_color="gray15")
-            modules_container.pack(fill="both", expand=True, padx=5, pady=5)
+        # Keep the header labels on the frame so header updates don't have to search for them
+        tab_content_frame._header_labels = (header_label, subheader_label)
 
-            # Store the modules container
-            self.tab_widgets[tab_module.id][tab_name] = modules_container
+        # Container for modules in this tab
+        modules_container = ctk.CTkScrollableFrame(tab_content_frame, fg_color="gray15")
+        modules_container.pack(fill="both", expand=True, padx=5, pady=5)
 
-            # If loading from file, add existing nested modules
-            if with_nested and tab_name in tab_module.sub_modules:
-                for nested_module in sorted(tab_module.sub_modules[tab_name], key=lambda m: m.position):
-                    self.add_module_to_tab_widget(tab_module, tab_name, nested_module)
+        # Store the modules container
+        self.tab_widgets.setdefault(tab_module.id, {})[tab_name] = modules_container
+
+        # If loading from file, add existing nested modules
+        nested_modules = tab_module.sub_modules.get(tab_name) if with_nested else None
+        if nested_modules:
+            for nested_module in nested_modules:
+                self.add_module_to_tab_widget(tab_module, tab_name, nested_module)
+
+        return tab_content_frame
 
     def _enable_tab_drop_zone(self, content_frame: ctk.CTkFrame, tab_module: 'TabModule', tab_name: str):
         """Enable the content frame as a drop zone for modules (including library modules)"""
 
         def on_click(event):
-            if self._safe_widget_exists(content_frame):
+            if not self._is_dragging() and self._safe_widget_exists(content_frame):
                 # Set tab context when explicitly clicking in the tab content area
                 self._set_tab_context(tab_module, tab_name)
 
@@ -215,6 +268,10 @@ class TabWidgetManager:
         content_frame.bind("<Button-1>", on_click)
         content_frame.bind("<Enter>", on_enter)
         content_frame.bind("<Leave>", on_leave)
+        content_frame._bound_events = tuple((content_frame, sequence) for sequence in _DROP_ZONE_EVENTS)
+
+        # Remember the resting color up front so drag highlighting never has to query it
+        content_frame._original_color = content_frame.cget("fg_color")
 
         # Store drop zone info for drag detection (works for both existing module drags and library drags)
         content_frame._drop_zone_info = {
@@ -228,15 +285,17 @@ class TabWidgetManager:
         if tab_module.id not in self.tab_widgets:
             return
 
-        # Get or create the container for this tab
-        if tab_name not in self.tab_widgets[tab_module.id]:
-            self.switch_active_tab(tab_module, tab_name)
-
+        # A tab that has never been shown has no container yet - building it on first show
+        # creates the widgets of every module it holds, this one included
         container = self.tab_widgets[tab_module.id].get(tab_name)
-        if not container or not self._safe_widget_exists(container):
-            print(f"Error: Container for tab '{tab_name}' not found after attempting to switch/create.")
+        if container is None:
+            return
+        if not self._safe_widget_exists(container):
+            print(f"Error: Container for tab '{tab_name}' no longer exists.")
             return
 
+        widget_key = self.module_widget_manager.widget_key(module.id, (tab_module, tab_name))
+
         # Create module frame using the widget manager
         module_frame = self.module_widget_manager.create_module_frame(
             module,
@@ -247,8 +306,7 @@ class TabWidgetManager:
         module_frame.pack(fill="x", padx=5, pady=5)
 
         # Store reference (with tab context in the key)
-        widget_key = f"{tab_module.id}:{tab_name}:{module.id}"
-        self.module_widget_manager.module_widgets[widget_key] = module_frame
+        self.module_widget_manager.add_nested_widget(widget_key, module_frame)
 
         # Enable drag and drop for this module using the handler
         if hasattr(self.app, 'canvas_panel') and hasattr(self.app.canvas_panel, 'drag_drop_handler'):
@@ -258,40 +316,35 @@ class TabWidgetManager:
 
     def remove_module_from_tab_widget(self, tab_module: 'TabModule', tab_name: str, module_id: str):
         """Remove a module widget from a tab"""
-        widget_key = f"{tab_module.id}:{tab_name}:{module_id}"
-        if widget_key in self.module_widget_manager.module_widgets:
-            widget = self.module_widget_manager.module_widgets[widget_key]
+        widget_key = self.module_widget_manager.widget_key(module_id, (tab_module, tab_name))
+        widget = self.module_widget_manager.pop_nested_widget(widget_key)
+        if widget is None:
+            return
 
-            # Clear selection if this widget is currently selected
-            if self.module_widget_manager.selected_widget == widget:
-                self.module_widget_manager.selected_widget = None
+        # Clear selection if this widget is currently selected
+        if self.module_widget_manager.selected_widget == widget:
+            self.module_widget_manager.selected_widget = None
 
-            self._safe_destroy_widget(widget)
-            del self.module_widget_manager.module_widgets[widget_key]
+        self._safe_destroy_widget(widget)
+        self.module_widget_manager.preview_labels.pop(module_id, None)
 
     def on_tab_click(self, tab_module: 'TabModule', tab_name: str):
         """Handle tab selection - for VIEWING only, not setting add context"""
-        if tab_name not in tab_module.content_data['tabs']:
+        new_active_index = tab_module.tab_index(tab_name)
+        if new_active_index is None:
             return
 
         old_active_index = tab_module.content_data.get('active_tab', 0)
-        new_active_index = tab_module.content_data['tabs'].index(tab_name)
 
         # Only switch if it's actually a different tab
         if old_active_index != new_active_index:
-            # Update the active tab in the module
-            tab_module.content_data['active_tab'] = new_active_index
-
-            # Switch the visible content
-            self._switch_tab_content(tab_module, tab_name)
-
-            # Update button appearances
-            self._update_tab_button_states(tab_module)
+            # Switch the visible content, building it if this tab hasn't been shown yet
+            self.switch_active_tab(tab_module, tab_name)
 
             # DON'T automatically set this as the add context
             # User needs to explicitly click in the tab content area for that
 
-            self.app.set_modified(True)
+            self.app.canvas_panel.schedule_modified()
 
     def _switch_tab_content(self, tab_module: 'TabModule', new_active_tab: str):
         """Switch visible tab content without destroying widgets"""
@@ -299,23 +352,19 @@ class TabWidgetManager:
         if not tab_module_widget or not self._safe_widget_exists(tab_module_widget):
             return
 
-        # Find the content area
-        content_area = self._find_content_area(tab_module_widget)
-        if not content_area:
-            return
-
         # Hide all tab content frames and show the active one
-        for widget in content_area.winfo_children():
-            if not self._safe_widget_exists(widget):
+        for tab_name, content_frame in self.tab_content_frames.get(tab_module.id, {}).items():
+            if not self._safe_widget_exists(content_frame):
                 continue
 
-            if hasattr(widget, '_tab_name'):
-                if widget._tab_name == new_active_tab:
-                    widget.pack(fill="both", expand=True, padx=5, pady=5)
-                    # Update the header text with current module count
-                    self._update_tab_header(widget, tab_module, widget._tab_name)
-                else:
-                    widget.pack_forget()
+            if tab_name == new_active_tab:
+                content_frame.pack(fill="both", expand=True, padx=5, pady=5)
+                # Update the header text with current module count
+                self._update_tab_header(content_frame, tab_module, tab_name)
+            else:
+                content_frame.pack_forget()
+
+        self.shown_tabs[tab_module.id] = new_active_tab
 
     def refresh_tab_module(self, tab_module: 'TabModule'):
         """Refresh the entire tab module widget - simplified version"""
@@ -326,15 +375,12 @@ class TabWidgetManager:
         self._cleanup_tab_widget_references(tab_module.id)
 
         # Remove and recreate the widget
-        if tab_module.id in self.module_widget_manager.module_widgets:
-            widget = self.module_widget_manager.module_widgets[tab_module.id]
-            if self._safe_widget_exists(widget):
-                self._safe_destroy_widget(widget)
-            del self.module_widget_manager.module_widgets[tab_module.id]
+        widget = self.module_widget_manager.module_widgets.pop(tab_module.id, None)
+        if self._safe_widget_exists(widget):
+            self._safe_destroy_widget(widget)
 
         # Clean up tab widget references
-        if tab_module.id in self.tab_widgets:
-            del self.tab_widgets[tab_module.id]
+        self.clear_tab_widgets(tab_module.id)
 
         # Recreate with the preserved active tab
         try:
@@ -353,181 +399,63 @@ class TabWidgetManager:
             print(f"Error refreshing tab module: {e}")
 
     def switch_active_tab(self, tab_module: 'TabModule', tab_name: str):
-        """Switch the visible tab content with improved safety"""
-        # Find the parent_frame of the tab_module
-        if tab_module.id not in self.module_widget_manager.module_widgets:
-            return
-
-        tab_module_main_frame = self.module_widget_manager.module_widgets[tab_module.id]
+        """Switch the visible tab content, building the tab's content frame on first use"""
+        tab_module_main_frame = self.module_widget_manager.module_widgets.get(tab_module.id)
         if not self._safe_widget_exists(tab_module_main_frame):
             return
 
-        # Find tab_container within tab_module_main_frame
-        tab_container = None
-        try:
-            for child in tab_module_main_frame.winfo_children():
-                if isinstance(child, ctk.CTkFrame) and self._safe_widget_exists(child):
-                    try:
-                        if child.cget("fg_color") == "gray20":
-                            tab_container = child
-                            break
-                    except tk.TclError:
-                        continue
-        except tk.TclError:
+        tab_index = tab_module.tab_index(tab_name)
+        if tab_index is None:
             return
+        tab_module.content_data['active_tab'] = tab_index
 
-        if not tab_container or not self._safe_widget_exists(tab_container):
+        # Nothing to re-pack if this tab is already the one on screen
+        content_frame = self.tab_content_frames.get(tab_module.id, {}).get(tab_name)
+        if self.shown_tabs.get(tab_module.id) == tab_name and self._safe_widget_exists(content_frame):
+            self._update_tab_header(content_frame, tab_module, tab_name)
             return
 
-        # Clean up widget references before destroying widgets
-        self._cleanup_tab_widget_references(tab_module.id)
-
-        # Safely destroy existing content_frame
-        widgets_to_destroy = []
-        try:
-            for widget in tab_container.winfo_children():
-                if self._safe_widget_exists(widget):
-                    try:
-                        if widget.cget("fg_color") == "gray15":
-                            widgets_to_destroy.append(widget)
-                    except tk.TclError:
-                        pass
-        except tk.TclError:
-            pass
-
-        for widget in widgets_to_destroy:
-            self._safe_destroy_widget(widget)
-
-        # Recreate tab buttons and content
-        self._recreate_tab_interface(tab_module, tab_container, tab_name)
-
-    def _recreate_tab_interface(self, tab_module: 'TabModule', tab_container: ctk.CTkFrame, target_tab_name: str):
-        """Recreate tab buttons and content for the specified target tab"""
-        # Recreate tab buttons
-        tab_selector_frame = None
-        try:
-            for child in tab_container.winfo_children():
-                if isinstance(child, ctk.CTkFrame) and self._safe_widget_exists(child):
-                    try:
-                        if child.cget("fg_color") == "gray25":
-                            tab_selector_frame = child
-                            break
-                    except tk.TclError:
-                        continue
-        except tk.TclError:
-            pass
-
-        if tab_selector_frame and self._safe_widget_exists(tab_selector_frame):
-            # Clear existing buttons
-            buttons_to_destroy = []
-            try:
-                for widget in tab_selector_frame.winfo_children():
-                    if self._safe_widget_exists(widget):
-                        buttons_to_destroy.append(widget)
-            except tk.TclError:
-                pass
-
-            for widget in buttons_to_destroy:
-                self._safe_destroy_widget(widget)
-
-            # Create new buttons
-            self._create_tab_buttons(tab_module, tab_selector_frame, target_tab_name)
-
-        # Create new content frame for the selected tab
-        self._create_new_tab_content_frame(tab_module, tab_container, target_tab_name)
-
-    def _create_tab_buttons(self, tab_module: 'TabModule', tab_selector_frame: ctk.CTkFrame, active_tab_name: str):
-        """Create tab buttons with the specified active tab"""
-        try:
-            for i, tn in enumerate(tab_module.content_data['tabs']):
-                is_active = (tn == active_tab_name)
-                tab_btn = ctk.CTkButton(
-                    tab_selector_frame,
-                    text=tn,
-                    width=100,
-                    height=25,
-                    fg_color="gray30" if is_active else "gray40",
-                    command=lambda t_name=tn, tm=tab_module: self._safe_on_tab_click(tm, t_name)
-                )
-                tab_btn.pack(side="left", padx=2, pady=4)
-
-            add_tab_btn = ctk.CTkButton(
-                tab_selector_frame,
-                text="+",
-                width=30,
-                height=25,
-                command=lambda tm=tab_module: self._safe_add_new_tab(tm)
-            )
-            add_tab_btn.pack(side="left", padx=2)
-        except tk.TclError:
-            pass
-
-    def _create_new_tab_content_frame(self, tab_module: 'TabModule', tab_container: ctk.CTkFrame, tab_name: str):
-        """Create new content frame for the selected tab"""
-        if self._safe_widget_exists(tab_container):
-            try:
-                content_frame = ctk.CTkFrame(tab_container, fg_color="gray15")
-                content_frame.pack(fill="both", expand=True, padx=5, pady=5)
-
-                # Enable drop zone for this tab
-                self._enable_tab_drop_zone(content_frame, tab_module, tab_name)
-
-                # Header label for the tab content
-                if tab_name in tab_module.sub_modules and tab_module.sub_modules[tab_name]:
-                    header_text = f"'{tab_name}' tab content ({len(tab_module.sub_modules[tab_name])} modules)"
-                else:
-                    header_text = f"'{tab_name}' tab - Drop modules here or click to select"
-
-                header_label = ctk.CTkLabel(
-                    content_frame,
-                    text=header_text,
-                    font=("Arial", 12, "bold"),
-                    text_color="gray"
-                )
-                header_label.pack(pady=(10, 5))
-
-                # Container for modules in this tab
-                modules_container = ctk.CTkScrollableFrame(content_frame, fg_color="gray15")
-                modules_container.pack(fill="both", expand=True, padx=5, pady=5)
-
-                # Store the new content frame
-                self.tab_widgets[tab_module.id][tab_name] = modules_container
-
-                # Re-add modules for this tab
-                if tab_name in tab_module.sub_modules:
-                    for nested_module in sorted(tab_module.sub_modules[tab_name], key=lambda m: m.position):
-                        self.add_module_to_tab_widget(tab_module, tab_name, nested_module)
+        # Build the content frame only if this tab has never been shown (e.g. a newly added tab)
+        if not self._safe_widget_exists(content_frame):
+            content_area = self._find_content_area(tab_module.id)
+            if not content_area:
+                return
+            self._build_tab_content_frame(tab_module, content_area, tab_name, with_nested=True)
 
-            except tk.TclError as e:
-                print(f"Error creating tab content frame: {e}")
+        previous_tab = self.shown_tabs.get(tab_module.id)
+        self._switch_tab_content(tab_module, tab_name)
+        self._update_tab_button_states(tab_module, changed_tabs=(previous_tab, tab_name))
 
     def refresh_tab_content(self, tab_module: 'TabModule', tab_name: str):
         """Refresh the content of a specific tab"""
-        if tab_module.id not in self.tab_widgets or tab_name not in self.tab_widgets[tab_module.id]:
-            return
-
-        container = self.tab_widgets[tab_module.id][tab_name]
+        container = self.tab_widgets.get(tab_module.id, {}).get(tab_name)
         if not self._safe_widget_exists(container):
             return
 
-        # Clean up widget references for this specific tab before destroying widgets
-        keys_to_remove = []
-        for widget_key in list(self.module_widget_manager.module_widgets.keys()):
-            if widget_key.startswith(f"{tab_module.id}:{tab_name}:"):
-                keys_to_remove.append(widget_key)
+        modules = tab_module.sub_modules.get(tab_name, [])
+        current_ids = {module.id for module in modules}
 
-        for key in keys_to_remove:
-            if key in self.module_widget_manager.module_widgets:
-                widget = self.module_widget_manager.module_widgets[key]
-                if self.module_widget_manager.selected_widget == widget:
-                    self.module_widget_manager.selected_widget = None
-                del self.module_widget_manager.module_widgets[key]
+        # Keep the frames of modules still in the tab and drop references to the rest
+        reusable = {}
+        for key in self.module_widget_manager.nested_keys_in_tab(tab_module.id, tab_name):
+            widget = self.module_widget_manager.module_widgets.get(key)
+            if key[2] in current_ids and widget is not None and self._safe_widget_exists(widget):
+                reusable[key[2]] = widget
+                continue
 
-        # Clear existing widgets in the container
+            self.module_widget_manager.pop_nested_widget(key)
+            self.module_widget_manager.preview_labels.pop(key[2], None)
+            if widget is not None and self.module_widget_manager.selected_widget == widget:
+                self.module_widget_manager.selected_widget = None
+
+        # Unpack reused frames and destroy everything else in the container
         widgets_to_destroy = []
+        reusable_frames = set(reusable.values())
         try:
             for widget in container.winfo_children():
-                if self._safe_widget_exists(widget):
+                if widget in reusable_frames:
+                    widget.pack_forget()
+                elif self._safe_widget_exists(widget):
                     widgets_to_destroy.append(widget)
         except tk.TclError:
             pass
@@ -535,26 +463,41 @@ class TabWidgetManager:
         for widget in widgets_to_destroy:
             self._safe_destroy_widget(widget)
 
-        # Re-add modules in correct order
-        if tab_name in tab_module.sub_modules:
-            for module in sorted(tab_module.sub_modules.get(tab_name, []), key=lambda m: m.position):
-                try:
+        # Re-pack modules in correct order, creating frames only for new ones
+        for module in modules:
+            try:
+                module_frame = reusable.get(module.id)
+                if module_frame is not None:
+                    module_frame.pack(fill="x", padx=5, pady=5)
+                    self.module_widget_manager.update_module_preview(module)
+                else:
                     self.add_module_to_tab_widget(tab_module, tab_name, module)
-                except Exception as e:
-                    print(f"Error adding module to tab widget: {e}")
+            except Exception as e:
+                print(f"Error adding module to tab widget: {e}")
 
     def clear_tab_widgets(self, tab_module_id: str):
         """Clear all tab widgets for a specific tab module"""
-        if tab_module_id in self.tab_widgets:
-            del self.tab_widgets[tab_module_id]
+        self.tab_widgets.pop(tab_module_id, None)
+        self.tab_content_frames.pop(tab_module_id, None)
+        self.tab_containers.pop(tab_module_id, None)
+        self.tab_selectors.pop(tab_module_id, None)
+        self.tab_buttons.pop(tab_module_id, None)
+        self.shown_tabs.pop(tab_module_id, None)
 
     def clear_all_tab_widgets(self):
         """Clear all tab widgets"""
         self.tab_widgets.clear()
+        self.tab_content_frames.clear()
+        self.tab_containers.clear()
+        self.tab_selectors.clear()
+        self.tab_buttons.clear()
+        self.shown_tabs.clear()
 
     # Helper methods
     def _safe_on_tab_click(self, tab_module: 'TabModule', tab_name: str):
         """Safely handle tab selection with widget existence checks"""
+        if self._is_dragging():
+            return
         try:
             if not self._safe_widget_exists(self.module_widget_manager.module_widgets.get(tab_module.id)):
                 return
@@ -564,6 +507,8 @@ class TabWidgetManager:
 
     def _safe_add_new_tab(self, tab_module: 'TabModule'):
         """Safely add new tab with widget existence checks"""
+        if self._is_dragging():
+            return
         try:
             if not self._safe_widget_exists(self.module_widget_manager.module_widgets.get(tab_module.id)):
                 return
@@ -578,105 +523,79 @@ class TabWidgetManager:
 
         if tab_name and tab_name not in tab_module.content_data['tabs']:
             tab_module.add_tab(tab_name)
-            self.refresh_tab_module(tab_module)
-            self.app.set_modified(True)
+            # The new tab's content is built the first time it's shown, so only its button is needed
+            if self._append_tab_button(tab_module, tab_name):
+                self.module_widget_manager.update_module_preview(tab_module)
+            else:
+                self.refresh_tab_module(tab_module)
+            self.app.canvas_panel.schedule_modified()
 
-    def _update_tab_button_states(self, tab_module: 'TabModule'):
-        """Update the visual state of tab buttons"""
+    def _update_tab_button_states(self, tab_module: 'TabModule',
+                                  changed_tabs: Optional[Tuple[Optional[str], str]] = None):
+        """Update the visual state of tab buttons - only those in changed_tabs when given"""
         tab_module_widget = self.module_widget_manager.module_widgets.get(tab_module.id)
         if not tab_module_widget or not self._safe_widget_exists(tab_module_widget):
             return
 
-        # Find the tab selector frame
-        tab_selector_frame = None
-        try:
-            for child in tab_module_widget.winfo_children():
-                if (isinstance(child, ctk.CTkFrame) and
-                        self._safe_widget_exists(child) and
-                        hasattr(child, '_tab_selector_frame')):
-                    tab_selector_frame = child._tab_selector_frame
-                    break
-        except tk.TclError:
-            return
-
-        if not tab_selector_frame:
-            return
-
-        # Update button colors
+        # Recolor the existing buttons in place
         active_tab_index = tab_module.content_data.get('active_tab', 0)
-        button_index = 0
+        tabs = tab_module.content_data['tabs']
+        active_tab_name = tabs[active_tab_index] if 0 <= active_tab_index < len(tabs) else None
 
-        try:
-            for widget in tab_selector_frame.winfo_children():
-                if (isinstance(widget, ctk.CTkButton) and
-                        self._safe_widget_exists(widget) and
-                        widget.cget("text") != "+"):  # Skip the add button
+        buttons = self.tab_buttons.get(tab_module.id, {})
+        if changed_tabs is not None:
+            buttons = {name: buttons[name] for name in changed_tabs if name in buttons}
 
-                    is_active = (button_index == active_tab_index)
-                    try:
-                        widget.configure(
-                            fg_color="gray30" if is_active else "gray40",
-                            hover_color="gray35" if is_active else "gray45"
-                        )
-                    except tk.TclError:
-                        pass
-                    button_index += 1
-        except tk.TclError:
-            pass
+        for tab_name, tab_btn in buttons.items():
+            is_active = (tab_name == active_tab_name)
+            try:
+                tab_btn.configure(
+                    fg_color="gray30" if is_active else "gray40",
+                    hover_color="gray35" if is_active else "gray45"
+                )
+            except tk.TclError:
+                pass
 
-    def _update_tab_header(self, tab_content_frame, tab_module: 'TabModule', tab_name: str):
-        """Update the header text for a tab"""
+    @staticmethod
+    def _tab_header_texts(tab_module: 'TabModule', tab_name: str) -> Tuple[str, str]:
+        """Header and subheader text for a tab's content frame"""
         module_count = len(tab_module.sub_modules.get(tab_name, []))
         if module_count > 0:
-            header_text = f"'{tab_name}' tab ({module_count} modules)"
-            subheader_text = "Drag modules here or click to add new ones"
-        else:
-            header_text = f"'{tab_name}' tab - Empty"
-            subheader_text = "Drag modules from left panel or click to select this tab"
-
-        # Find and update the header labels
-        labels_updated = 0
-        try:
-            for widget in tab_content_frame.winfo_children():
-                if (isinstance(widget, ctk.CTkLabel) and
-                        self._safe_widget_exists(widget) and
-                        "tab" in widget.cget("text")):
-
-                    if labels_updated == 0:  # Main header
-                        widget.configure(text=header_text)
-                    elif labels_updated == 1:  # Subheader
-                        widget.configure(text=subheader_text)
-                        break
-                    labels_updated += 1
-        except tk.TclError:
-            pass
+            return (f"'{tab_name}' tab ({module_count} modules)",
+                    "Drag modules here or click to add new ones")
+        return (f"'{tab_name}' tab - Empty",
+                "Drag modules from left panel or click to select this tab")
 
-    def _find_content_area(self, tab_module_widget):
-        """Find the content area within a tab module widget"""
+    def _update_tab_header(self, tab_content_frame, tab_module: 'TabModule', tab_name: str):
+        """Update the header text for a tab"""
+        header_labels = getattr(tab_content_frame, '_header_labels', None)
+        if header_labels is None:
+            return
+
+        header_text, subheader_text = self._tab_header_texts(tab_module, tab_name)
+        header_label, subheader_label = header_labels
         try:
-            for child in tab_module_widget.winfo_children():
-                if (isinstance(child, ctk.CTkFrame) and
-                        self._safe_widget_exists(child) and
-                        hasattr(child, '_content_area')):
-                    return child._content_area
+            header_label.configure(text=header_text)
+            subheader_label.configure(text=subheader_text)
         except tk.TclError:
             pass
-        return None
+
+    def _find_content_area(self, tab_module_id: str):
+        """Find the content area of a tab module's container"""
+        tab_container = self.tab_containers.get(tab_module_id)
+        if not self._safe_widget_exists(tab_container):
+            return None
+        return getattr(tab_container, '_content_area', None)
 
     def _cleanup_tab_widget_references(self, tab_module_id: str):
         """Clean up widget references for a tab module before recreating them"""
-        keys_to_remove = []
-        for widget_key in list(self.module_widget_manager.module_widgets.keys()):
-            if widget_key.startswith(f"{tab_module_id}:"):
-                keys_to_remove.append(widget_key)
+        keys_to_remove = self.module_widget_manager.pop_tab_module_keys(tab_module_id)
 
         for key in keys_to_remove:
-            if key in self.module_widget_manager.module_widgets:
-                widget = self.module_widget_manager.module_widgets[key]
-                # Clear selection if this widget is currently selected
-                if self.module_widget_manager.selected_widget == widget:
-                    self.module_widget_manager.selected_widget = None
-                del self.module_widget_manager.module_widgets[key]
+            widget = self.module_widget_manager.module_widgets.pop(key, None)
+            # Clear selection if this widget is currently selected
+            if widget is not None and self.module_widget_manager.selected_widget == widget:
+                self.module_widget_manager.selected_widget = None
 
     def _set_tab_context(self, tab_module: 'TabModule', tab_name: str):
         """Set the selected tab context for adding new modules with visual feedback"""
@@ -699,14 +618,11 @@ class TabWidgetManager:
 
     def _clear_add_target_highlights(self):
         """Clear all add target highlights"""
-        for tab_id, tab_containers in self.tab_widgets.items():
-            for tab_name, container in tab_containers.items():
-                if self._safe_widget_exists(container):
-                    # Find the parent content frame
+        for content_frames in self.tab_content_frames.values():
+            for content_frame in content_frames.values():
+                if self._safe_widget_exists(content_frame):
                     try:
-                        parent = container.master
-                        if self._safe_widget_exists(parent):
-                            parent.configure(border_width=1, border_color="gray20")
+                        content_frame.configure(border_width=1, border_color="gray20")
                     except tk.TclError:
                         pass
 
@@ -718,6 +634,4 @@ class TabWidgetManager:
 
     def _is_dragging(self) -> bool:
         """Check if currently dragging (delegates to drag drop handler)"""
-        if hasattr(self.app, 'canvas_panel') and hasattr(self.app.canvas_panel, 'drag_drop_handler'):
-            return self.app.canvas_panel.drag_drop_handler.is_dragging
-        return False
\ No newline at end of file
+        return self.module_widget_manager.drag_drop_handler.is_dragging
\ No newline at end of file
@@ -0,0 +1,13 @@
+# gui/utils/__init__.py
+"""
+GUI Utilities Package
+
+This package contains small helpers shared by the canvas renderers and handlers:
+- bindings: Helpers for routing events through shared bind tags
+- widget_safety: Checks for widgets that may already have been destroyed
+"""
+
+from .bindings import add_bindtag, find_tagged_ancestor
+from .widget_safety import safe_widget_exists, is_child_of, cached_widget_checks
+
+__all__ = ['add_bindtag', 'find_tagged_ancestor', 'safe_widget_exists', 'is_child_of', 'cached_widget_checks']
@@ -0,0 +1,31 @@
+# gui/utils/bindings.py
+"""
+Binding Helpers
+
+Utilities for routing events through shared Tk bind tags, so one class binding
+can serve many widgets instead of binding a callback to each of them.
+"""
+
+
+def add_bindtag(widget, tag: str):
+    """
+    Put a bind tag in front of a widget's own bindings
+
+    CTk widgets draw through inner Tk widgets (a canvas and, for labels, a text
+    label) that receive the actual mouse events, so those get the tag as well.
+
+    Args:
+        widget: The Tk or CTk widget to tag
+        tag: Bind tag name, bound once with bind_class
+    """
+    for target in (widget, getattr(widget, '_canvas', None), getattr(widget, '_label', None)):
+        if target is not None and tag not in target.bindtags():
+            target.bindtags((tag,) + target.bindtags())
+
+
+def find_tagged_ancestor(widget, attribute: str):
+    """Walk up from the widget that received an event to the nearest widget carrying attribute"""
+    current = widget
+    while current is not None and not hasattr(current, attribute):
+        current = getattr(current, 'master', None)
+    return current
@@ -0,0 +1,63 @@
+# gui/utils/widget_safety.py
+"""
+Widget Safety Helpers
+
+Shared checks for widgets that may already have been destroyed, used by the
+canvas panel, its widget managers and the canvas drag and drop handlers.
+"""
+
+from contextlib import contextmanager
+from typing import Any, Dict, Optional, Tuple
+import tkinter as tk
+
+# Existence results for the current event handler - id(widget) -> (widget, exists).
+# The widget is kept alongside its result so its id cannot be reused while cached.
+_exists_cache: Optional[Dict[int, Tuple[Any, bool]]] = None
+
+
+def safe_widget_exists(widget) -> bool:
+    """Safely check if a widget exists and hasn't been destroyed"""
+    if widget is None or getattr(widget, '_destroying', False):
+        return False
+
+    if _exists_cache is not None:
+        cached = _exists_cache.get(id(widget))
+        if cached is not None:
+            return cached[1]
+
+    try:
+        exists = bool(widget.winfo_exists())
+    except (tk.TclError, AttributeError):
+        exists = False
+
+    if _exists_cache is not None:
+        _exists_cache[id(widget)] = (widget, exists)
+    return exists
+
+
+def is_child_of(widget, parent) -> bool:
+    """Check if widget is a descendant of parent"""
+    current = getattr(widget, 'master', None)
+    while current is not None:
+        if current == parent:
+            return True
+        current = getattr(current, 'master', None)
+    return False
+
+
+@contextmanager
+def cached_widget_checks():
+    """
+    Cache safe_widget_exists results for the duration of one event handler
+
+    Widgets cannot be destroyed while a handler runs unless the handler destroys
+    them itself, so only wrap code that does not create or destroy widgets.
+    """
+    global _exists_cache
+    outer_cache = _exists_cache
+    if outer_cache is None:
+        _exists_cache = {}
+    try:
+        yield
+    finally:
+        _exists_cache = outer_cache
@@ -15,6 +15,8 @@ class Module(ABC):
         self.position = 0  # Order in the SOP
         self.content_data = {}
         self.custom_styles = {}
+        self.content_version = 0  # Bumped on every content update
+        self.structure_version = 0  # Bumped when nested structure (tabs, sub-modules) changes
 
     @abstractmethod
     def get_default_content(self) -> Dict[str, Any]:
@@ -114,6 +116,7 @@ class Module(ABC):
     def update_content(self, key: str, value: Any):
         """Update specific content field"""
         self.content_data[key] = value
+        self.content_version += 1
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize module to dictionary for saving"""
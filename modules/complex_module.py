@@ -10,8 +10,10 @@ class TabModule(Module):
     def __init__(self):
         super().__init__('tabs', 'Tab Section')
         self.content_data = self.get_default_content()
-        self.sub_modules: Dict[str, List[Module]] = {}  # Tab name -> modules
+        # Tab name -> modules, each list kept in position order
+        self.sub_modules: Dict[str, List[Module]] = {}
         self.tab_ids: Dict[str, str] = {}  # Tab name -> unique ID for persistence
+        self._tab_index: Dict[str, int] = {}  # Tab name -> position in content_data['tabs']
 
     def get_default_content(self) -> Dict[str, Any]:
         return {
@@ -23,9 +25,11 @@ class TabModule(Module):
         """Add a new tab and return its ID"""
         if tab_name not in self.content_data['tabs']:
             self.content_data['tabs'].append(tab_name)
+            self._tab_index[tab_name] = len(self.content_data['tabs']) - 1
             tab_id = str(uuid.uuid4())
             self.tab_ids[tab_name] = tab_id
             self.sub_modules[tab_name] = []
+            self.structure_version += 1
             return tab_id
         return self.tab_ids.get(tab_name, '')
 
@@ -33,6 +37,7 @@ class TabModule(Module):
         """Remove a tab and all its modules"""
         if tab_name in self.content_data['tabs'] and len(self.content_data['tabs']) > 1:
             self.content_data['tabs'].remove(tab_name)
+            self._tab_index.clear()
             if tab_name in self.sub_modules:
                 del self.sub_modules[tab_name]
             if tab_name in self.tab_ids:
@@ -40,22 +45,41 @@ class TabModule(Module):
             # Reset active tab if needed
             if self.content_data['active_tab'] >= len(self.content_data['tabs']):
                 self.content_data['active_tab'] = 0
+            self.structure_version += 1
 
     def rename_tab(self, old_name: str, new_name: str):
         """Rename a tab"""
-        if old_name in self.content_data['tabs'] and new_name not in self.content_data['tabs']:
-            idx = self.content_data['tabs'].index(old_name)
+        idx = self.tab_index(old_name)
+        if idx is not None and self.tab_index(new_name) is None:
             self.content_data['tabs'][idx] = new_name
+            self._tab_index[new_name] = self._tab_index.pop(old_name)
             # Move sub-modules
             if old_name in self.sub_modules:
                 self.sub_modules[new_name] = self.sub_modules.pop(old_name)
             # Move tab ID
             if old_name in self.tab_ids:
                 self.tab_ids[new_name] = self.tab_ids.pop(old_name)
+            self.structure_version += 1
+
+    def update_content(self, key: str, value: Any):
+        """Update specific content field - replacing the tab list is a structural change"""
+        super().update_content(key, value)
+        if key == 'tabs':
+            self.structure_version += 1
+
+    def tab_index(self, tab_name: str) -> Optional[int]:
+        """Get the position of a tab, or None if there is no such tab"""
+        tabs = self.content_data['tabs']
+        index = self._tab_index.get(tab_name)
+        if index is None or index >= len(tabs) or tabs[index] != tab_name:
+            # Rebuild the cached map - content_data may have been replaced or edited directly
+            self._tab_index = {name: i for i, name in enumerate(tabs)}
+            index = self._tab_index.get(tab_name)
+        return index
 
     def add_module_to_tab(self, tab_name: str, module: Module) -> bool:
         """Add a module to a specific tab"""
-        if tab_name not in self.content_data['tabs']:
+        if self.tab_index(tab_name) is None:
             return False
 
         if tab_name not in self.sub_modules:
@@ -64,18 +88,21 @@ class TabModule(Module):
         # Set module position within the tab
         module.position = len(self.sub_modules[tab_name])
         self.sub_modules[tab_name].append(module)
+        self.structure_version += 1
         return True
 
     def remove_module_from_tab(self, tab_name: str, module_id: str) -> Optional[Module]:
         """Remove a module from a tab and return it"""
         if tab_name in self.sub_modules:
-            for i, module in enumerate(self.sub_modules[tab_name]):
-                if module.id == module_id:
-                    removed_module = self.sub_modules[tab_name].pop(i)
-                    # Update positions
-                    for j, m in enumerate(self.sub_modules[tab_name]):
-                        m.position = j
-                    return removed_module
+            modules = self.sub_modules[tab_name]
+            module_index = self._index_of(modules, module_id)
+            if module_index is not None:
+                removed_module = modules.pop(module_index)
+                # Update positions of the modules that moved up
+                for j in range(module_index, len(modules)):
+                    modules[j].position = j
+                self.structure_version += 1
+                return removed_module
         return None
 
     def get_all_nested_modules(self) -> List[Module]:
@@ -93,23 +120,27 @@ class TabModule(Module):
                     return tab_name
         return None
 
-    def reorder_module_in_tab(self, tab_name: str, module_id: str, new_position: int):
-        """Reorder a module within its tab"""
+    def reorder_module_in_tab(self, tab_name: str, module_id: str, new_position: int,
+                              current_index: Optional[int] = None):
+        """Reorder a module within its tab - current_index spares the lookup when the caller knows it"""
         if tab_name in self.sub_modules:
             modules = self.sub_modules[tab_name]
-            # Find the module
-            module_index = None
-            for i, module in enumerate(modules):
-                if module.id == module_id:
-                    module_index = i
-                    break
+            module_index = self._index_of(modules, module_id, current_index)
 
             if module_index is not None and 0 <= new_position < len(modules):
                 module = modules.pop(module_index)
                 modules.insert(new_position, module)
-                # Update all positions
-                for i, m in enumerate(modules):
-                    m.position = i
+                # Update positions of the modules between the old and new slots
+                for i in range(min(module_index, new_position), max(module_index, new_position) + 1):
+                    modules[i].position = i
+                self.structure_version += 1
+
+    @staticmethod
+    def _index_of(modules: List[Module], module_id: str, hint: Optional[int] = None) -> Optional[int]:
+        """Index of a module in a tab's module list, or None if it isn't there"""
+        if hint is not None and 0 <= hint < len(modules) and modules[hint].id == module_id:
+            return hint
+        return next((i for i, m in enumerate(modules) if m.id == module_id), None)
 
     def render_to_html(self) -> str:
         """Generate HTML for tabbed content - simplified version for use with HTML generator"""
@@ -137,8 +168,7 @@ class TabModule(Module):
             # Get content for this tab - simple version without cards
             content = ''
             if tab in self.sub_modules:
-                sorted_modules = sorted(self.sub_modules[tab], key=lambda m: m.position)
-                for module in sorted_modules:
+                for module in self.sub_modules[tab]:
                     content += module.render_to_html()
 
             # If no content, show placeholder
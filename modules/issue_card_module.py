@@ -297,6 +297,6 @@ class IssueCardModule(Module):
         """Update specific content field with path normalization"""
         if key in ['issue_media_source', 'solution_single_media_source']:
             # Normalize file paths when they're updated
-            self.content_data[key] = self._normalize_file_path(value)
-        else:
-            self.content_data[key] = value
\ No newline at end of file
+            value = self._normalize_file_path(value)
+
+        super().update_content(key, value)
\ No newline at end of file
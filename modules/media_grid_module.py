@@ -210,6 +210,6 @@ class MediaGridModule(Module):
                     normalized_items.append(normalized_item)
                 else:
                     normalized_items.append(item)
-            self.content_data[key] = normalized_items
-        else:
-            self.content_data[key] = value
\ No newline at end of file
+            value = normalized_items
+
+        super().update_content(key, value)
\ No newline at end of file
@@ -254,8 +254,6 @@ class MediaModule(Module):
 
             # Normalize file paths when they're updated (but not base64 data)
             if value and not self._is_base64_data(str(value)):
-                self.content_data[key] = self._normalize_file_path(value)
-            else:
-                self.content_data[key] = value
-        else:
-            self.content_data[key] = value
+                value = self._normalize_file_path(value)
+
+        super().update_content(key, value)
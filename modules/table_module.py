@@ -149,7 +149,7 @@ class TableModule(Module):
 
                     cleaned_sections.append(cleaned_section)
 
-            self.content_data[key] = cleaned_sections
+            value = cleaned_sections
         elif key == 'sections' and isinstance(value, str):
             # Handle JSON string input (fallback)
             try:
@@ -158,5 +158,6 @@ class TableModule(Module):
             except json.JSONDecodeError:
                 # If JSON parsing fails, keep existing data
                 pass
-        else:
-            self.content_data[key] = value
\ No newline at end of file
+            return
+
+        super().update_content(key, value)
\ No newline at end of file
@@ -0,0 +1,127 @@
+# tests/test_canvas_panel.py
+"""Tests for CanvasPanel"""
+
+from types import SimpleNamespace
+import tkinter as tk
+
+import pytest
+
+ctk = pytest.importorskip("customtkinter")
+
+from gui.canvas_panel import CanvasPanel
+from gui.renderers import ModuleWidgetManager, TabWidgetManager
+from modules.header_module import HeaderModule
+
+
+@pytest.fixture
+def root():
+    try:
+        root = ctk.CTk()
+    except tk.TclError:
+        pytest.skip("no display available")
+    root.withdraw()
+    yield root
+    root.destroy()
+
+
+@pytest.fixture
+def panel(root):
+    parent = ctk.CTkFrame(root)
+    parent.pack(fill="both", expand=True)
+    app = SimpleNamespace(
+        root=root,
+        active_modules=[],
+        selected_tab_context=None,
+        main_window=SimpleNamespace(is_dragging_from_library=False)
+    )
+    return CanvasPanel(parent, app)
+
+
+def test_chunked_load_reports_modules_as_their_widgets_exist(root, panel):
+    modules = [HeaderModule() for _ in range(3)]
+    built = []
+    finished = []
+
+    def on_built(module):
+        assert module.id in panel.module_widget_manager.module_widgets
+        built.append(module)
+
+    panel.load_module_widgets(modules, on_built=on_built, on_done=lambda: finished.append(list(built)),
+                              on_error=pytest.fail, frame_budget=0)
+    root.update()
+    assert 0 < len(built) < len(modules)
+
+    # Later batches are scheduled 1 ms apart
+    for _ in range(100):
+        if finished:
+            break
+        root.after(5)
+        root.update()
+
+    assert built == modules
+    assert finished == [modules]
+
+
+def test_clear_during_chunked_load(root, panel):
+    modules = [HeaderModule() for _ in range(5)]
+    built = []
+    finished = []
+    errors = []
+
+    # A zero frame budget builds one module per batch, so the load is still pending below
+    panel.load_module_widgets(modules, on_built=built.append, on_done=lambda: finished.append(True),
+                              on_error=errors.append, frame_budget=0)
+    root.update()
+    assert panel._pending_load is not None
+    old_frame = panel.modules_frame
+
+    panel.clear()
+    for _ in range(10):
+        root.update()
+
+    assert panel._pending_load is None
+    assert not old_frame.winfo_exists()
+    assert panel.parent.pack_slaves() == [panel.modules_frame]
+    assert panel.module_widget_manager.module_widgets == {}
+    assert len(built) < len(modules)
+    assert finished == []
+    assert errors == []
+
+
+def make_modules(ids: str):
+    return [SimpleNamespace(id=module_id) for module_id in ids]
+
+
+def test_lookup_builds_index_map():
+    modules = make_modules('abc')
+    index_map = {}
+    assert CanvasPanel._lookup_module_index(modules, 'b', index_map) == 1
+    assert index_map == {'a': 0, 'b': 1, 'c': 2}
+
+
+def test_lookup_rebuilds_stale_index_map():
+    modules = make_modules('abc')
+    index_map = {}
+    CanvasPanel._lookup_module_index(modules, 'a', index_map)
+    modules.reverse()
+    assert CanvasPanel._lookup_module_index(modules, 'a', index_map) == 2
+    assert index_map == {'c': 0, 'b': 1, 'a': 2}
+
+
+def test_lookup_of_missing_module():
+    assert CanvasPanel._lookup_module_index(make_modules('ab'), 'z', {}) is None
+
+
+def test_swap_updates_both_entries():
+    modules = make_modules('abc')
+    index_map = {'a': 0, 'b': 1, 'c': 2}
+    modules[0], modules[1] = modules[1], modules[0]
+    CanvasPanel._swap_module_index(modules, index_map, 0, 1)
+    assert index_map == {'b': 0, 'a': 1, 'c': 2}
+
+
+@pytest.mark.parametrize('cls', [CanvasPanel, ModuleWidgetManager, TabWidgetManager])
+def test_panel_and_managers_reject_undeclared_attributes(cls):
+    instance = object.__new__(cls)
+    with pytest.raises(AttributeError):
+        instance.undeclared = True
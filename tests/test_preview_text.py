@@ -0,0 +1,59 @@
+# tests/test_preview_text.py
+"""Tests for canvas preview text formatting"""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("customtkinter")
+
+from gui.renderers.module_widget_manager import ModuleWidgetManager, _preview_for, preview_text
+
+
+def make_module(module_type: str, **content_data):
+    return SimpleNamespace(module_type=module_type, content_data=content_data, display_name=module_type)
+
+
+def preview(module) -> str:
+    # Formatting doesn't touch the manager's widgets, so no manager instance is needed
+    return ModuleWidgetManager.get_preview_text(None, module)
+
+
+def test_preview_text_is_cached_per_content():
+    _preview_for.cache_clear()
+    module = make_module('header', title='Intro')
+    assert preview(module) == "📄 Intro"
+    assert preview(module) == "📄 Intro"
+    info = _preview_for.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_preview_text_follows_content_changes():
+    module = make_module('header', title='Intro')
+    preview(module)
+    module.content_data['title'] = 'Next steps'
+    assert preview(module) == "📄 Next steps"
+
+
+def test_unknown_module_type_shows_display_name():
+    assert preview(make_module('custom')) == "custom"
+
+
+def test_disclaimer_with_long_content_is_not_marked_as_cut():
+    module = make_module('disclaimer', label='IMPORTANT!', content='x' * 150)
+    assert preview_text(module) == "⚠️ IMPORTANT!"
+
+
+def test_text_of_exactly_the_limit_is_marked():
+    module = make_module('text', content='a' * 100)
+    assert preview_text(module) == "📝 " + 'a' * 100 + "..."
+
+
+def test_long_text_is_cut_at_the_limit():
+    module = make_module('text', content='a' * 150)
+    assert preview_text(module) == "📝 " + 'a' * 100 + "..."
+
+
+def test_short_text_is_shown_whole():
+    module = make_module('text', content='short')
+    assert preview_text(module) == "📝 short"
@@ -602,7 +602,7 @@ class HTMLGenerator:
             # Get modules for this tab and organize them
             tab_modules = []
             if tab in tab_module.sub_modules:
-                tab_modules = sorted(tab_module.sub_modules[tab], key=lambda m: m.position)
+                tab_modules = tab_module.sub_modules[tab]
 
             # Group modules by sections (disclaimer + section_title + following modules)
             sections = self._group_modules_by_sections(tab_modules)
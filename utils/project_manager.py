@@ -98,6 +98,11 @@ class ProjectManager:
                 # Recursively deserialize nested modules
                 sub_module = self.deserialize_module(sub_module_data)
                 tab_module.sub_modules[tab_name].append(sub_module)
+            # Keep the tab's modules in position order so views can iterate it directly, and
+            # renumber them so saved files with gaps or duplicate positions load consistently
+            tab_module.sub_modules[tab_name].sort(key=lambda m: m.position)
+            for i, sub_module in enumerate(tab_module.sub_modules[tab_name]):
+                sub_module.position = i
 
         return tab_module
 